@@ -1,135 +1,242 @@
 """
 Parser module for SES files in the pattern nesting application.
 """
-import re
 import os
+import mmap
+import logging
+from collections import namedtuple
+
+
+_LOG = logging.getLogger(__name__)
+
+
+# A placed piece; tuples avoid a per-piece dict for markers with many pieces
+Piece = namedtuple('Piece', ['id', 'x', 'y', 'angle', 'flip'])
+
+# SES files are scanned as raw bytes, so all keywords are bytes. Both SES
+# dialects (MARKER_WIDTH / NLOC (x,y) and NWIDTH / NLOC X Y) share these
+# tables: every line costs one dict lookup whichever dialect it uses
+
+# Single-value piece keywords mapped to (field, conversion)
+_PIECE_KEYWORDS = {
+    b'ANGLE': ('ANGLE', float),
+    b'ROTATION': ('ROTATION', float),
+    b'FLIP_FLAG': ('FLIP_FLAG', int),
+    b'HORZ_FLIP': ('HORZ_FLIP', int),
+    b'PIECE_ID': ('PIECE_ID', int),
+}
+
+# Marker keywords mapped to (field, priority); lower priority wins when a file
+# carries several spellings of the same field
+_MARKER_KEYWORDS = {
+    b'MARKER_WIDTH': ('width', 0),
+    b'NWIDTH': ('width', 1),
+    b'WIDTH:': ('width', 2),
+    b'MARKER_LENGTH': ('length', 0),
+    b'HEIGHT:': ('length', 1),
+    b'MARKER_EFFICIENCY': ('efficiency', 0),
+    b'EFFICIENCY:': ('efficiency', 1),
+}
+
+
+def _iter_lines(file_path):
+    """
+    Iterate over the lines of a file through a read-only memory map
+
+    The file pages stay in the OS page cache; nothing is decoded or copied
+    into a single in-process buffer.
+
+    Args:
+        file_path (str): Path to the file
+
+    Yields:
+        bytes: Each line of the file, including its line ending
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+
+def _first_number(parts, convert=float):
+    """
+    Convert the value following a keyword token
+
+    Args:
+        parts (list): Whitespace-separated tokens of a line
+        convert: Conversion function for the value
+
+    Returns:
+        The converted value, or None if missing or malformed
+    """
+    if len(parts) < 2:
+        return None
+    try:
+        return convert(parts[1])
+    except ValueError:
+        return None
+
+
+def _parse_nloc(rest, fields):
+    """
+    Parse the value of an NLOC line into the piece fields
+
+    Supports the "(x, y)" tuple form as well as "X x", "Y y" and "X x Y y",
+    with or without a space between the axis letter and the value. Values
+    already present in the fields are kept.
+
+    Args:
+        rest (bytes): The line contents following the NLOC keyword
+        fields (dict): Fields of the piece being read
+    """
+    rest = rest.strip()
+    try:
+        if rest.startswith(b'('):
+            # Format: NLOC (x,y)
+            x_text, _, y_text = rest[1:].partition(b')')[0].partition(b',')
+            fields['NLOC'] = (float(x_text), float(y_text))
+            return
+
+        # Alternative format: NLOC X... Y...
+        tokens = rest.split()
+        for i, token in enumerate(tokens):
+            axis = token[:1]
+            if axis not in (b'X', b'Y'):
+                continue
+            value = token[1:] or (tokens[i + 1] if i + 1 < len(tokens) else b'')
+            key = 'NLOC_X' if axis == b'X' else 'NLOC_Y'
+            if key not in fields:
+                fields[key] = float(value)
+    except ValueError:
+        pass
+
+
+def _build_piece(fields):
+    """
+    Build a piece record from the fields collected between BEGIN_PIECE and END_PIECE
+
+    Args:
+        fields (dict): First value seen for each piece keyword
+
+    Returns:
+        Piece: Piece data, or None if no valid ID could be extracted
+    """
+    piece_id = fields.get('BEGIN_PIECE')
+
+    # Extract piece position - try various formats
+    x, y = 0, 0
+    if 'NLOC' in fields:
+        # Format: NLOC (x,y)
+        x, y = fields['NLOC']
+    elif 'NLOC_X' in fields and 'NLOC_Y' in fields:
+        # Alternative format: NLOC X... Y...
+        x = fields['NLOC_X']
+        y = fields['NLOC_Y']
+
+    # Extract angle, falling back to the alternative rotation format
+    angle = fields.get('ANGLE', fields.get('ROTATION', 0))
+
+    # Extract flip flag; HORZ_FLIP 1 also marks the piece as flipped
+    flip = 1 if fields.get('HORZ_FLIP') == 1 else fields.get('FLIP_FLAG', 0)
+
+    # Handle PIECE_ID and BUNDLE_ID format
+    if piece_id is None or piece_id < 0:
+        piece_id = fields.get('PIECE_ID')
+
+    # Check if we were able to extract a valid ID
+    if piece_id is None:
+        _LOG.warning("Unable to extract valid ID from piece data: %s", fields)
+        return None
+
+    return Piece(piece_id, x, y, angle, flip)
 
 
 def parse_ses_file(ses_file_path):
     """
     Parse a SES file and extract nesting information
+
+    The file is read in a single streaming pass; each line is dispatched on
+    its leading keyword.
     
     Args:
         ses_file_path (str): Path to the SES file
         
     Returns:
-        dict: Parsed nesting data containing marker info and pieces, or None on error
+        dict: Parsed nesting data containing marker info and a list of Piece
+            tuples, or None on error
     """
     nesting_data = {
         'marker_info': {},
         'pieces': []
     }
 
+    # Priority of the keyword each marker field was taken from
+    marker_priority = {}
+
     try:
-        with open(ses_file_path, 'r', errors='ignore') as f:
-            content = f.read()
-
-            # Extract marker information
-            # Width
-            width_match = re.search(r'MARKER_WIDTH\s+(\d+(\.\d+)?)', content)
-            if width_match:
-                nesting_data['marker_info']['width'] = float(width_match.group(1))
-
-            # Alternative width (NWIDTH)
-            nwidth_match = re.search(r'NWIDTH\s+(\d+(\.\d+)?)', content)
-            if nwidth_match and not width_match:
-                nesting_data['marker_info']['width'] = float(nwidth_match.group(1))
-
-            # Check for WIDTH tag (used in some formats)
-            width2_match = re.search(r'WIDTH:\s+(\d+(\.\d+)?)', content)
-            if width2_match and not width_match and not nwidth_match:
-                nesting_data['marker_info']['width'] = float(width2_match.group(1))
-
-            # Length
-            length_match = re.search(r'MARKER_LENGTH\s+(\d+(\.\d+)?)', content)
-            if length_match:
-                nesting_data['marker_info']['length'] = float(length_match.group(1))
-
-            # Alternative length (HEIGHT)
-            height_match = re.search(r'HEIGHT:\s+(\d+(\.\d+)?)', content)
-            if height_match and not length_match:
-                nesting_data['marker_info']['length'] = float(height_match.group(1))
-
-            # Efficiency
-            efficiency_match = re.search(r'MARKER_EFFICIENCY\s+(\d+(\.\d+)?)', content)
-            if efficiency_match:
-                nesting_data['marker_info']['efficiency'] = float(efficiency_match.group(1))
-
-            # Alternative efficiency
-            eff2_match = re.search(r'EFFICIENCY:\s+(\d+(\.\d+)?)', content)
-            if eff2_match and not efficiency_match:
-                nesting_data['marker_info']['efficiency'] = float(eff2_match.group(1))
-
-            # Extract piece information - try multiple patterns
-            # Standard BEGIN_PIECE format
-            piece_pattern = r'BEGIN_PIECE\s+(\d+)(.*?)END_PIECE'
-            piece_matches = re.finditer(piece_pattern, content, re.DOTALL)
-
-            for piece_match in piece_matches:
-                piece_id = int(piece_match.group(1))
-                piece_data = piece_match.group(2)
-
-                # Extract piece position - try various formats
-                x, y = 0, 0
-
-                # Format: NLOC (x,y)
-                nloc_match = re.search(r'NLOC\s+\((\d+(\.\d+)?),\s*(\d+(\.\d+)?)\)', piece_data)
-                if nloc_match:
-                    x = float(nloc_match.group(1))
-                    y = float(nloc_match.group(3))
-                else:
-                    # Try alternative format: NLOC X... Y...
-                    loc_x_match = re.search(r'NLOC\s+X\s*([+-]?\d+(\.\d+)?)', piece_data)
-                    loc_y_match = re.search(r'NLOC\s+Y\s*([+-]?\d+(\.\d+)?)', piece_data)
-                    if loc_x_match and loc_y_match:
-                        x = float(loc_x_match.group(1))
-                        y = float(loc_y_match.group(1))
-
-                # Extract angle
-                angle = 0
-                angle_match = re.search(r'ANGLE\s+([+-]?\d+(\.\d+)?)', piece_data)
-                if angle_match:
-                    angle = float(angle_match.group(1))
-                else:
-                    # Try alternative rotation format
-                    rot_match = re.search(r'ROTATION\s+([+-]?\d+(\.\d+)?)', piece_data)
-                    if rot_match:
-                        angle = float(rot_match.group(1))
-
-                # Extract flip flag
-                flip = 0
-                flip_match = re.search(r'FLIP_FLAG\s+(\d+)', piece_data)
-                if flip_match:
-                    flip = int(flip_match.group(1))
-
-                # Alternative flip flags
-                horz_flip_match = re.search(r'HORZ_FLIP\s+(\d+)', piece_data)
-                vert_flip_match = re.search(r'VERT_FLIP\s+(\d+)', piece_data)
-
-                if horz_flip_match and int(horz_flip_match.group(1)) == 1:
-                    flip = 1
-
-                # Handle PIECE_ID and BUNDLE_ID format
-                if piece_id is None or piece_id < 0:
-                    piece_id_match = re.search(r'PIECE_ID\s+(\d+)', piece_data)
-                    if piece_id_match:
-                        piece_id = int(piece_id_match.group(1))
-
-                # Check if we were able to extract a valid ID
-                if piece_id is None:
-                    print(f"Warning: Unable to extract valid ID from piece data: {piece_data[:100]}...")
-                    continue
-
-                # Add piece to the data
-                nesting_data['pieces'].append({
-                    'id': piece_id,
-                    'x': x,
-                    'y': y,
-                    'angle': angle,
-                    'flip': flip
-                })
-
-        print(f"Parsed SES file with {len(nesting_data['pieces'])} pieces")
+        piece_fields = None  # Fields of the piece being read, None outside a piece
+
+        for line in _iter_lines(ses_file_path):
+            # Only the keyword and its first value are ever needed
+            parts = line.split(None, 2)
+            if not parts:
+                continue
+            head = parts[0]
+
+            if piece_fields is not None:
+                if head == b'END_PIECE':
+                    piece = _build_piece(piece_fields)
+                    if piece is not None:
+                        nesting_data['pieces'].append(piece)
+                    piece_fields = None
+                elif head == b'NLOC':
+                    # A tuple position takes precedence, so once one is found
+                    # the remaining NLOC lines of the piece can be skipped
+                    if 'NLOC' not in piece_fields and len(parts) > 1:
+                        _parse_nloc(line.split(None, 1)[1], piece_fields)
+                elif head in _PIECE_KEYWORDS:
+                    field, convert = _PIECE_KEYWORDS[head]
+                    if field in piece_fields or (field == 'ROTATION' and 'ANGLE' in piece_fields):
+                        continue
+                    value = _first_number(parts, convert)
+                    if value is not None:
+                        piece_fields[field] = value
+                elif head == b'BEGIN_PIECE':
+                    # Unterminated piece - start over with the new one
+                    piece_fields = {'BEGIN_PIECE': _first_number(parts, int)}
+            elif head == b'BEGIN_PIECE':
+                piece_fields = {'BEGIN_PIECE': _first_number(parts, int)}
+            elif head in _MARKER_KEYWORDS:
+                # Extract marker information, keeping the first value of the
+                # highest-priority keyword seen for each field
+                key, priority = _MARKER_KEYWORDS[head]
+                if priority < marker_priority.get(key, len(_MARKER_KEYWORDS)):
+                    value = _first_number(parts)
+                    if value is not None:
+                        nesting_data['marker_info'][key] = value
+                        marker_priority[key] = priority
+
+        _LOG.debug("Parsed SES file with %d pieces", len(nesting_data['pieces']))
+
+        # Find the piece coordinate ranges in a single pass
+        if nesting_data['pieces']:
+            min_x = min_y = float('inf')
+            max_x = max_y = float('-inf')
+            for piece in nesting_data['pieces']:
+                x = piece.x
+                y = piece.y
+                if x < min_x:
+                    min_x = x
+                if x > max_x:
+                    max_x = x
+                if y < min_y:
+                    min_y = y
+                if y > max_y:
+                    max_y = y
+        else:
+            min_x = max_x = min_y = max_y = 0
 
         # Ensure we have a valid width and length
         if 'width' not in nesting_data['marker_info'] or nesting_data['marker_info']['width'] <= 0:
@@ -137,24 +244,15 @@ def parse_ses_file(ses_file_path):
 
         if 'length' not in nesting_data['marker_info'] or nesting_data['marker_info']['length'] <= 0:
             # Calculate length based on piece positions
-            max_y = 0
-            for piece in nesting_data['pieces']:
-                max_y = max(max_y, piece['y'] + 50)  # Rough estimate
-            nesting_data['marker_info']['length'] = max_y + 20
+            max_extent = max(0, max_y + 50) if nesting_data['pieces'] else 0  # Rough estimate
+            nesting_data['marker_info']['length'] = max_extent + 20
 
         # Check if we need to adjust the coordinate system
         # Some nesting software may use a different origin point or coordinate direction
         # Look for pieces outside the expected area
-        max_x = max([p['x'] for p in nesting_data['pieces']]) if nesting_data['pieces'] else 0
-        max_y = max([p['y'] for p in nesting_data['pieces']]) if nesting_data['pieces'] else 0
-        min_x = min([p['x'] for p in nesting_data['pieces']]) if nesting_data['pieces'] else 0
-        min_y = min([p['y'] for p in nesting_data['pieces']]) if nesting_data['pieces'] else 0
-
-        print(f"Piece coordinate ranges: X: {min_x} to {max_x}, Y: {min_y} to {max_y}")
+        _LOG.debug("Piece coordinate ranges: X: %s to %s, Y: %s to %s", min_x, max_x, min_y, max_y)
 
         return nesting_data
-    except Exception as e:
-        import traceback
-        print(f"Error parsing SES file: {e}")
-        traceback.print_exc()
+    except Exception:
+        _LOG.exception("Error parsing SES file %s", ses_file_path)
         return None
\ No newline at end of file
@@ -3,8 +3,36 @@ Settings management for the pattern nesting application.
 Handles saving and loading application settings.
 """
 import os
+import copy
 import json
 
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+
+_INSTANCE = None  # Shared SettingsManager, see get_settings_manager()
+
+# Settings used when no settings file exists or it cannot be read
+_DEFAULTS = {
+    "nesting_program": "",
+    "recent_files": [],
+    "default_width": 50,
+    "default_efficiency": 80,
+    "default_time_limit": 1
+}
+
+
+def get_settings_manager():
+    """
+    Get the shared settings manager, creating it on first use
+
+    Returns:
+        SettingsManager: The application-wide settings manager
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = SettingsManager()
+    return _INSTANCE
+
 
 class SettingsManager:
     """Manages application settings like file paths and preferences"""
@@ -14,9 +42,11 @@ class SettingsManager:
         self.settings_dir = os.path.join(os.path.expanduser("~"), ".pattern_nesting")
         self.settings_file = os.path.join(self.settings_dir, "settings.json")
         self.settings = {}
-        
-        # Create settings directory if it doesn't exist
-        os.makedirs(self.settings_dir, exist_ok=True)
+        self._last_serialized = None  # Compact JSON of the settings last written / read
+        self._loaded_mtime = None  # Modification time of the settings file when last read
+        self._dirty = False  # Settings changed but not yet written
+        self._flush_scheduled = False
+        self._quit_hooked = False
         
         # Load existing settings if available
         self.load_settings()
@@ -24,17 +54,71 @@ class SettingsManager:
     def save_settings(self, settings_dict=None):
         """
         Save settings to file
+
+        When a Qt application is running the write is deferred briefly so that
+        bursts of changes are coalesced into a single write; the pending write
+        is also flushed when the application quits.
         
         Args:
             settings_dict (dict, optional): Dictionary of settings to save.
                 If None, saves the current settings
+
+        Returns:
+            bool: True if successful (or scheduled), False otherwise
+        """
+        if settings_dict is not None:
+            self.settings.update(settings_dict)
+        self._dirty = True
+
+        app = QCoreApplication.instance()
+        if app is None:
+            # No event loop to defer to - write immediately
+            return self._write_now()
+
+        if not self._quit_hooked:
+            app.aboutToQuit.connect(self.flush)
+            self._quit_hooked = True
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(500, self.flush)
+        return True
+
+    def flush(self):
+        """
+        Write pending settings changes to file, if any
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._flush_scheduled = False
+        if not self._dirty:
+            return True
+        return self._write_now()
+
+    def _write_now(self):
+        """
+        Write the current settings to file immediately
+
+        Returns:
+            bool: True if successful, False otherwise
         """
         try:
-            if settings_dict is not None:
-                self.settings.update(settings_dict)
-                
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            # Skip the disk write when nothing has changed since the last save.
+            # The compact form goes through json's C encoder; the indented file
+            # format is only produced when there is something to write.
+            snapshot = json.dumps(self.settings)
+            if snapshot == self._last_serialized:
+                self._dirty = False
+                return True
+
+            with open(self.settings_file, 'w', buffering=65536) as f:
+                f.write(json.dumps(self.settings, indent=4))
+            # Only a successful write clears the pending change, so a failed
+            # one is retried by the next flush
+            self._dirty = False
+            self._last_serialized = snapshot
+            self._loaded_mtime = os.stat(self.settings_file).st_mtime_ns
                 
             print(f"Settings saved to {self.settings_file}")
             return True
@@ -50,30 +134,26 @@ class SettingsManager:
             dict: The loaded settings
         """
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    self.settings = json.load(f)
-                print(f"Settings loaded from {self.settings_file}")
-            else:
-                # Initialize with default settings
-                self.settings = {
-                    "nesting_program": "",
-                    "recent_files": [],
-                    "default_width": 50,
-                    "default_efficiency": 80,
-                    "default_time_limit": 1
-                }
+            with open(self.settings_file, 'r') as f:
+                # Nothing to do if the file hasn't changed since it was last read
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                if mtime == self._loaded_mtime:
+                    return self.settings
+
+                self.settings = json.load(f)
+            self._last_serialized = json.dumps(self.settings)
+            self._loaded_mtime = mtime
+            print(f"Settings loaded from {self.settings_file}")
+            return self.settings
+        except FileNotFoundError:
+            # First run - create the settings directory and use default settings
+            os.makedirs(self.settings_dir, exist_ok=True)
+            self.settings = copy.deepcopy(_DEFAULTS)
             return self.settings
         except Exception as e:
             print(f"Failed to load settings: {str(e)}")
             # Initialize with default settings on error
-            self.settings = {
-                "nesting_program": "",
-                "recent_files": [],
-                "default_width": 50,
-                "default_efficiency": 80,
-                "default_time_limit": 1
-            }
+            self.settings = copy.deepcopy(_DEFAULTS)
             return self.settings
     
     def get(self, key, default=None):
@@ -113,7 +193,11 @@ class SettingsManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        recent_files = self.settings.get("recent_files", [])
+        recent_files = list(self.settings.get("recent_files", []))
+
+        # Re-opening the most recent file leaves the list as it is
+        if recent_files and recent_files[0] == file_path:
+            return True
         
         # Remove if already exists (to move it to the top)
         if file_path in recent_files:
@@ -123,6 +207,9 @@ class SettingsManager:
         recent_files.insert(0, file_path)
         
         # Keep only the 10 most recent files
-        self.settings["recent_files"] = recent_files[:10]
+        recent_files = recent_files[:10]
+        if recent_files == self.settings.get("recent_files"):
+            return True
+        self.settings["recent_files"] = recent_files
         
         return self.save_settings()
\ No newline at end of file
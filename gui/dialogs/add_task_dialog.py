@@ -156,7 +156,7 @@ class AddTaskDialog(QDialog):
             self, "Выбрать файл WRK", "", "WRK Files (*.wrk)"
         )
         if file_path:
-            if not file_path.lower().endswith('.wrk'):
+            if os.path.splitext(file_path)[1].lower() != '.wrk':
                 file_path += '.wrk'
             self.wrk_file = file_path
             self.wrk_path_edit.setText(file_path)
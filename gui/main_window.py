@@ -2,27 +2,206 @@
 Main window for pattern nesting application.
 """
 import os
-import re
+import logging
+import math
+import hashlib
 import subprocess
 import time
+from pathlib import Path
+import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QLabel, QPushButton, QFileDialog, QGraphicsScene, QGraphicsPathItem,
-                           QTableWidget, QTableWidgetItem, QTabWidget,
+                           QLabel, QPushButton, QFileDialog, QGraphicsScene,
+                           QTableWidget, QTableWidgetItem, QTabWidget, QHeaderView,
                            QLineEdit, QGroupBox, QFormLayout, QCheckBox, QSpinBox, QDoubleSpinBox,
-                           QMessageBox, QStatusBar, QAction, QToolBar, QSplitter, QFrame,
-                           QGraphicsItemGroup, QDialog, QProgressBar, QApplication)
-from PyQt5.QtGui import QPen, QBrush, QPainterPath, QColor, QFont, QIcon, QPainter, QPixmap, QTransform
-from PyQt5.QtCore import Qt, QPointF, QRectF, QSizeF, QTimer
+                           QMessageBox, QStatusBar, QAction, QToolBar, QSplitter, QPlainTextEdit,
+                           QGraphicsItem, QGraphicsItemGroup, QDialog, QProgressBar, QApplication)
+from PyQt5.QtGui import QPen, QBrush, QPainterPath, QPolygonF, QColor, QFont, QIcon, QPainter, QPixmap, QTransform
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize, QSizeF, QTimer, QObject, QProcess, QThread, pyqtSignal
 
 import ezdxf
 
 from core.parser import parse_ses_file
-from core.settings import SettingsManager
+from core.settings import get_settings_manager
 from gui.widgets.graphics_view import PatternGraphicsView
-from gui.widgets.preview_widget import PatternPreviewWidget
+from gui.widgets.preview_widget import PREVIEW_SIZE, render_pattern_thumbnail
+from gui.widgets.pattern_item import PatternItem
+from gui.widgets.label_overlay import LabelOverlay
 from gui.process_manager import NestingProcessManager
 
 
+_LOG = logging.getLogger(__name__)
+
+# Patterns with fewer points than this are measured with a plain loop
+_LOOP_METRICS_MAX_POINTS = 64
+
+# Model and paper space block names (lowercase), never treated as patterns
+_SKIP_BLOCK_NAMES = frozenset({'*model_space', '*paper_space', '$model_space', '$paper_space'})
+
+
+def _array_to_polygon(vertices):
+    """
+    Build a QPolygonF from a vertex array
+
+    The points are copied straight into the polygon's buffer, so the
+    binding is crossed once per polygon instead of once per vertex.
+
+    Args:
+        vertices (numpy.ndarray): (N, 2) float64 array of vertex coordinates
+
+    Returns:
+        QPolygonF: Polygon with the same points
+    """
+    polygon = QPolygonF(len(vertices))
+    buffer = polygon.data()
+    buffer.setsize(vertices.size * vertices.itemsize)
+    np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = vertices
+    return polygon
+
+
+def _path_points(path):
+    """
+    Get the MoveTo/LineTo points of a path as an array
+
+    The points are copied out of the path's subpath polygons, in element
+    order, without visiting each element from Python.
+
+    Args:
+        path (QPainterPath): Path made of line segments
+
+    Returns:
+        numpy.ndarray: (N, 2) float64 array of the path points
+    """
+    arrays = []
+    for polygon in path.toSubpathPolygons():
+        if polygon.isEmpty():
+            continue
+        buffer = polygon.data()
+        buffer.setsize(len(polygon) * 2 * 8)
+        arrays.append(np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2))
+
+    if not arrays:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.concatenate(arrays)
+
+
+def _path_to_xy(path):
+    """
+    Get the MoveTo/LineTo coordinates of a path as separate arrays
+
+    Args:
+        path (QPainterPath): Path made of line segments
+
+    Returns:
+        tuple: (xs, ys) contiguous float64 arrays of the path points
+    """
+    points = _path_points(path)
+    return np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+
+
+def _loop_metrics(xs, ys):
+    """
+    Compute the area and perimeter of a closed polygon point by point
+
+    Args:
+        xs (numpy.ndarray): Polygon x coordinates
+        ys (numpy.ndarray): Polygon y coordinates
+
+    Returns:
+        tuple: (area, perimeter) of the polygon
+    """
+    xs = xs.tolist()
+    ys = ys.tolist()
+    if not xs:
+        return 0.0, 0.0
+
+    # Start from the last point so the closing edge is included
+    prev_x, prev_y = xs[-1], ys[-1]
+    perimeter = 0.0
+    twice_area = 0.0
+    hypot = math.hypot  # Single C call per edge, looked up once
+    for x, y in zip(xs, ys):
+        perimeter += hypot(x - prev_x, y - prev_y)
+        twice_area += prev_x * y - x * prev_y
+        prev_x, prev_y = x, y
+    return abs(twice_area) / 2.0, perimeter
+
+
+def _grid_layout(sizes, columns, spacing, margin_x, margin_y):
+    """
+    Compute the grid positions of patterns laid out row by row
+
+    A new row starts every `columns` patterns. It is moved down by the
+    tallest pattern of the previous row or the first pattern of the new
+    row, whichever is taller, plus the spacing.
+
+    Args:
+        sizes (numpy.ndarray): (N, 2) array of pattern widths and heights
+        columns (int): Number of patterns per row
+        spacing: Spacing between patterns
+        margin_x: Left margin
+        margin_y: Top margin
+
+    Returns:
+        tuple: (x positions, y positions, max width, max height) of the layout
+    """
+    count = len(sizes)
+    if not count:
+        return [], [], 0, 0
+
+    row_count = -(-count // columns)
+    cells = row_count * columns
+
+    # Widths and heights including spacing, padded to whole rows
+    widths = np.zeros(cells)
+    widths[:count] = sizes[:, 0] + spacing
+    heights = np.full(cells, -np.inf)
+    heights[:count] = sizes[:, 1] + spacing
+
+    # The x after each pattern is the running width sum within its row,
+    # starting at the margin
+    row_widths = widths.reshape(row_count, columns).copy()
+    row_widths[:, 0] += margin_x
+    x_after = np.cumsum(row_widths, axis=1).reshape(-1)[:count]
+
+    # Each row is offset by the larger of the previous row height and the
+    # height of its own first pattern
+    row_heights = heights.reshape(row_count, columns).max(axis=1)
+    steps = np.maximum(row_heights[:-1], heights[columns::columns])
+    row_y = np.cumsum(np.concatenate(([margin_y], steps)))
+
+    xs = x_after - widths[:count]
+    ys = row_y[np.arange(count) // columns]
+    return xs.tolist(), ys.tolist(), float(x_after.max()), float((row_y + row_heights).max())
+
+
+class DxfLoadWorker(QObject):
+    """Worker that reads a DXF file and builds its pattern paths off the GUI thread"""
+
+    finished = pyqtSignal(object)  # Parameter is the loaded pattern data
+    failed = pyqtSignal(str)  # Parameter is the error message
+
+    def __init__(self, file_path, load_function):
+        """
+        Initialize the worker
+
+        Args:
+            file_path: Path to the DXF file
+            load_function: Callable building the pattern data from the file path
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.load_function = load_function
+
+    def run(self):
+        """Load the file and emit the result"""
+        try:
+            self.finished.emit(self.load_function(self.file_path))
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.failed.emit(str(e))
+
+
 class PatternNestingApp(QMainWindow):
     """Main application window for pattern nesting tool"""
     
@@ -32,18 +211,31 @@ class PatternNestingApp(QMainWindow):
 
         # Application state
         self.dxf_file_path = None
+        self._dxf_meta = None  # (path, directory, stem) of the DXF file
         self.nesting_program_path = None
         self.wrk_file_path = None
         self.blocks = []  # Store the blocks from the DXF file
         self.entities = []  # Store direct entities from the DXF file
         self.pattern_paths = []  # Store QPainterPath objects for each pattern
         self.pattern_colors = []  # Store colors for each pattern
+        self.pattern_vertices = []  # Store (xs, ys) point arrays for each pattern
+        self._pattern_bounds = []  # Untransformed bounding rect of each pattern path
+        self._block_names = {}  # id of a DXF block -> name shown for its pattern
+        self._metric_cache = {}  # id of a pattern path -> (area, perimeter)
+        self._pattern_pens = {}  # RGBA value -> shared pattern outline pen
+        self._pattern_brushes = {}  # RGBA value -> shared pattern fill brush
+
+        # DXF load running in the background, if any
+        self._dxf_thread = None
+        self._dxf_worker = None
+        self._dxf_progress = None
+        self._pending_ses_file = None  # SES file to show once the DXF load finishes
 
         # Store a single instance of the process manager
         self.process_manager = None
         
         # Initialize settings manager
-        self.settings_manager = SettingsManager()
+        self.settings_manager = get_settings_manager()
 
         # Initialize the user interface
         self.init_ui()
@@ -189,6 +381,7 @@ class PatternNestingApp(QMainWindow):
         # Create graphics view for pattern display
         self.view = PatternGraphicsView()
         self.scene = QGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.view.setScene(self.scene)
 
         # Add pattern view to tab widget
@@ -203,6 +396,7 @@ class PatternNestingApp(QMainWindow):
         # Add a tab for nesting results
         self.nesting_result_view = PatternGraphicsView()
         self.nesting_result_scene = QGraphicsScene()
+        self.nesting_result_scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.nesting_result_view.setScene(self.nesting_result_scene)
         self.right_panel.addTab(self.nesting_result_view, "Nesting Result")
 
@@ -318,58 +512,152 @@ class PatternNestingApp(QMainWindow):
             self, "Select WRK File Location", "", "WRK Files (*.wrk)"
         )
         if file_path:
-            if not file_path.lower().endswith('.wrk'):
+            if os.path.splitext(file_path)[1].lower() != '.wrk':
                 file_path += '.wrk'
             self.wrk_file_path = file_path
             self.wrk_path_edit.setText(file_path)
             self.statusBar.showMessage(f"WRK file location: {os.path.basename(file_path)}")
 
     def load_dxf(self):
-        """Load and parse DXF file"""
+        """Load and parse DXF file in a background thread"""
         if not self.dxf_file_path:
             QMessageBox.warning(self, "Warning", "Please select a DXF file first.")
             return
 
+        # Ignore repeated requests while a file is still loading
+        if self._dxf_thread is not None:
+            return
+
         self.statusBar.showMessage("Loading DXF file...")
-        try:
-            # Load the DXF file
-            doc = ezdxf.readfile(self.dxf_file_path)
+        self.load_btn.setEnabled(False)
+
+        # Busy indicator while the worker runs
+        self._dxf_progress = QProgressBar()
+        self._dxf_progress.setRange(0, 0)
+        self._dxf_progress.setMaximumWidth(150)
+        self.statusBar.addPermanentWidget(self._dxf_progress)
+
+        # Reading and path building run in the worker; only the finished
+        # paths come back to the GUI thread
+        thread = QThread(self)
+        worker = DxfLoadWorker(self.dxf_file_path, self.read_dxf_patterns)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_dxf_loaded)
+        worker.failed.connect(self._on_dxf_load_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._dxf_thread = thread
+        self._dxf_worker = worker
+        thread.start()
+
+    def read_dxf_patterns(self, file_path):
+        """
+        Read a DXF file and build the pattern paths of its blocks/entities
 
-            # Clear previous display
-            self.scene.clear()
-            self.blocks = []
-            self.entities = []
-            self.pattern_paths = []
-            self.pattern_colors = []
-
-            # Debug info
-            print(f"DXF version: {doc.dxfversion}")
-            print(f"Number of entities in modelspace: {len(doc.modelspace())}")
-            print(f"Number of blocks: {len(doc.blocks)}")
-
-            # List block names
-            print("Available blocks:")
-            for block in doc.blocks:
-                print(f"  - {block.name}")
-
-            # Get all blocks from the DXF
-            for block in doc.blocks:
-                # Skip model space
-                if block.name.lower() in ('*model_space', '*paper_space', '$model_space', '$paper_space'):
-                    continue
+        Runs in the DXF load worker thread, so it only builds data and never
+        touches widgets.
 
-                # In your file, blocks appear to start with 'B'
-                if block.name.startswith('B'):
-                    self.blocks.append(block)
-                    print(f"Adding block: {block.name} with {len(block)} entities")
+        Args:
+            file_path: Path to the DXF file
 
-            # If no blocks found, try to use entities directly from modelspace
-            if not self.blocks:
-                print("No blocks found, checking modelspace entities")
-                for entity in doc.modelspace():
-                    if entity.dxftype() in ('POLYLINE', 'LWPOLYLINE', 'LINE', 'SPLINE', 'HATCH'):
-                        self.entities.append(entity)
-                        print(f"Adding entity: {entity.dxftype()}")
+        Returns:
+            dict: Loaded 'blocks', 'entities', pattern 'paths', their 'colors',
+                'vertices' and 'bounds', and the 'block_names' keyed by block id
+        """
+        # Load the DXF file
+        doc = ezdxf.readfile(file_path)
+
+        # Debug info
+        debug = _LOG.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOG.debug("DXF version: %s", doc.dxfversion)
+            _LOG.debug("Number of entities in modelspace: %d", len(doc.modelspace()))
+            _LOG.debug("Number of blocks: %d", len(doc.blocks))
+
+        # Get the pattern blocks from the DXF in a single pass, skipping model
+        # space; in your file, blocks appear to start with 'B'
+        blocks = [
+            block for block in doc.blocks
+            if block.name.startswith('B')
+            and block.name.lower() not in _SKIP_BLOCK_NAMES
+        ]
+        if debug:
+            for block in blocks:
+                _LOG.debug("Adding block: %s with %d entities", block.name, len(block))
+
+        # If no blocks found, try to use entities directly from modelspace
+        entities = []
+        if not blocks:
+            _LOG.debug("No blocks found, checking modelspace entities")
+            entities = [
+                entity for entity in doc.modelspace()
+                if entity.dxftype() in ('POLYLINE', 'LWPOLYLINE', 'LINE', 'SPLINE', 'HATCH')
+            ]
+            if debug:
+                for entity in entities:
+                    _LOG.debug("Adding entity: %s", entity.dxftype())
+
+        # Process blocks and extract patterns
+        colors = [Qt.red, Qt.blue, Qt.green, Qt.magenta, Qt.darkCyan, Qt.darkRed, Qt.darkBlue, Qt.darkGreen]
+        pattern_paths, pattern_colors = self.extract_patterns_from_blocks(blocks, entities, colors)
+
+        # Pull the points and bounds out of each distinct path once
+        path_data = {}
+        pattern_vertices = []
+        pattern_bounds = []
+        for path in pattern_paths:
+            data = path_data.get(id(path))
+            if data is None:
+                data = path_data[id(path)] = (_path_to_xy(path), path.boundingRect())
+            pattern_vertices.append(data[0])
+            pattern_bounds.append(data[1])
+
+        # Look up block names once instead of rescanning blocks on every table fill
+        block_names = {id(block): self.get_block_name(block) for block in blocks}
+
+        return {
+            'blocks': blocks,
+            'entities': entities,
+            'paths': pattern_paths,
+            'colors': pattern_colors,
+            'vertices': pattern_vertices,
+            'bounds': pattern_bounds,
+            'block_names': block_names
+        }
+
+    def _finish_dxf_load(self):
+        """Remove the load indicator and allow the next DXF load"""
+        self.statusBar.removeWidget(self._dxf_progress)
+        self._dxf_progress.deleteLater()
+        self._dxf_progress = None
+        self._dxf_thread = None
+        self._dxf_worker = None
+        self.load_btn.setEnabled(True)
+
+    def _on_dxf_loaded(self, result):
+        """
+        Display the patterns built by the DXF load worker
+
+        Args:
+            result: Pattern data returned by read_dxf_patterns
+        """
+        self._finish_dxf_load()
+        ses_file, self._pending_ses_file = self._pending_ses_file, None
+        try:
+            # Clear previous display
+            self.scene.clear()
+            self.blocks = result['blocks']
+            self.entities = result['entities']
+            self.pattern_paths = result['paths']
+            self.pattern_colors = result['colors']
+            self.pattern_vertices = result['vertices']
+            self._pattern_bounds = result['bounds']
+            self._block_names = result['block_names']
+            self._metric_cache = {}
 
             # Display blocks and entities
             if self.blocks or self.entities:
@@ -387,233 +675,233 @@ class PatternNestingApp(QMainWindow):
             else:
                 self.statusBar.showMessage("No pattern pieces found in DXF file")
 
+            # Show a result that was waiting for these patterns
+            if ses_file:
+                self.view_session_file(ses_file)
+
         except Exception as e:
             import traceback
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Failed to load DXF file: {str(e)}")
             self.statusBar.showMessage("Error loading DXF file")
 
+    def _on_dxf_load_failed(self, message):
+        """
+        Report a DXF file that could not be loaded
+
+        Args:
+            message: Error message from the worker
+        """
+        self._finish_dxf_load()
+        self._pending_ses_file = None
+        QMessageBox.critical(self, "Error", f"Failed to load DXF file: {message}")
+        self.statusBar.showMessage("Error loading DXF file")
+
+    def closeEvent(self, event):
+        """
+        Wait for a running DXF load before the window is closed
+
+        Args:
+            event: Close event
+        """
+        if self._dxf_thread is not None:
+            self._dxf_thread.quit()
+            self._dxf_thread.wait()
+        super().closeEvent(event)
+
     def extract_and_display_patterns(self):
-        """Extract patterns from blocks/entities and display them"""
+        """Display the extracted patterns in a grid layout"""
         # Define a grid for pattern arrangement
         grid_spacing = 5  # Spacing between patterns (integer)
         grid_columns = 8  # Number of columns in the grid
-        max_width = 0
-        max_height = 0
-
-        # Add grid to scene for reference
-        self.add_grid_to_scene(self.scene)
-
-        # Process blocks and extract patterns
-        colors = [Qt.red, Qt.blue, Qt.green, Qt.magenta, Qt.darkCyan, Qt.darkRed, Qt.darkBlue, Qt.darkGreen]
-
-        # Extract patterns from blocks and entities
-        self.extract_patterns_from_blocks(colors)
 
         # Arrange patterns in a grid
         margin_x = grid_spacing
         margin_y = grid_spacing
-        curr_x = margin_x
-        curr_y = margin_y
-        row_height = 0
 
-        # Display patterns in a grid layout
-        for i, pattern_path in enumerate(self.pattern_paths):
-            color = self.pattern_colors[i]
+        # Compute every grid position up front from the pattern sizes
+        bounds = self._pattern_bounds
+        sizes = np.array([(rect.width(), rect.height()) for rect in bounds], dtype=np.float64).reshape(-1, 2)
+        xs, ys, max_width, max_height = _grid_layout(sizes, grid_columns, grid_spacing, margin_x, margin_y)
 
+        # Display patterns in a grid layout
+        for pattern_path, path_bounds, color, x, y in zip(self.pattern_paths, bounds, self.pattern_colors, xs, ys):
             # Create graphics item for the pattern
-            path_item = QGraphicsPathItem(pattern_path)
-            path_item.setPen(QPen(color, 0.5))
-            path_item.setBrush(QBrush(color, Qt.Dense4Pattern))
-
-            # Position the pattern in the grid
-            path_bounds = pattern_path.boundingRect()
+            path_item = PatternItem(pattern_path, self.pattern_pen(color), self.pattern_brush(color),
+                                    path_bounds=path_bounds)
 
-            # Adjust row height if needed
-            row_height = max(row_height, path_bounds.height() + grid_spacing)
-
-            # Check if we need to move to a new row
-            if (i > 0) and (i % grid_columns == 0):
-                curr_y += row_height
-                curr_x = margin_x
-                row_height = path_bounds.height() + grid_spacing
+            # Keep the rasterized pattern for pans and scrolls
+            path_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
             # Position the pattern
-            path_item.setPos(curr_x, curr_y)
+            path_item.setPos(x, y)
 
             # Add to scene
             self.scene.addItem(path_item)
 
-            # Update position for next pattern
-            curr_x += path_bounds.width() + grid_spacing
-
-            # Track maximum dimensions
-            max_width = max(max_width, curr_x)
-            max_height = max(max_height, curr_y + row_height)
-
         # Set scene rectangle to contain all patterns
         self.scene.setSceneRect(0, 0, max_width + margin_x, max_height + margin_y)
 
         # Fit view to show all patterns
         self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
-    def extract_patterns_from_blocks(self, colors):
+    def pattern_pen(self, color):
+        """
+        Get the shared outline pen for a pattern color
+
+        Args:
+            color: Pattern color
+
+        Returns:
+            QPen: Pattern outline pen
+        """
+        key = QColor(color).rgba()
+        pen = self._pattern_pens.get(key)
+        if pen is None:
+            pen = QPen(color, 0.5)
+            self._pattern_pens[key] = pen
+        return pen
+
+    def pattern_brush(self, color):
+        """
+        Get the shared Dense4Pattern fill brush for a color
+
+        Every pattern item of a color uses the same brush instead of
+        constructing its own.
+
+        Args:
+            color: Pattern color
+
+        Returns:
+            QBrush: Pattern fill brush
+        """
+        key = QColor(color).rgba()
+        brush = self._pattern_brushes.get(key)
+        if brush is None:
+            brush = QBrush(color, Qt.Dense4Pattern)
+            self._pattern_brushes[key] = brush
+        return brush
+
+    def extract_patterns_from_blocks(self, blocks, entities, colors):
         """
         Extract pattern paths from blocks and entities
         
         Args:
+            blocks: DXF blocks holding one pattern each
+            entities: Modelspace entities used when there are no blocks
             colors: List of colors to use for patterns
+
+        Returns:
+            tuple: (list of QPainterPath, list of colors) for the patterns
         """
+        pattern_paths = []
+        pattern_colors = []
+
+        # Block geometry digest -> shared QPainterPath
+        path_cache = {}
+
         # Process blocks
-        for i, block in enumerate(self.blocks):
+        for i, block in enumerate(blocks):
             color = colors[i % len(colors)]
 
-            # Create path for the block
+            # Create path for the block; with the odd-even rule, closed
+            # polylines inside the outline are filled as holes
             path = QPainterPath()
-            is_path_started = False
+            path.setFillRule(Qt.OddEvenFill)
 
-            # Calculate bounding box for Y-axis flipping
-            min_y = float('inf')
-            max_y = float('-inf')
-            all_vertices = []
+            # Collect the vertex array and closed flag of every entity
+            entity_arrays = []
+            closed_flags = []
 
-            # First pass - collect all vertices and find min/max Y
             for entity in block:
                 entity_type = entity.dxftype()
                 if entity_type in ('POLYLINE', 'LWPOLYLINE'):
                     vertices = self.extract_vertices(entity)
-                    if vertices:
-                        for x, y in vertices:
-                            min_y = min(min_y, y)
-                            max_y = max(max_y, y)
-                        all_vertices.append((entity_type, vertices, self.is_entity_closed(entity)))
+                    if not len(vertices):
+                        continue
+                    is_closed = self.is_entity_closed(entity)
                 elif entity_type == 'LINE':
                     try:
                         start = entity.dxf.start
                         end = entity.dxf.end
-                        min_y = min(min_y, start[1], end[1])
-                        max_y = max(max_y, start[1], end[1])
-                        all_vertices.append((entity_type, [start, end], False))
                     except:
-                        pass
-
-            # If we have valid bounds
-            if min_y != float('inf') and max_y != float('-inf'):
-                # Second pass - create the path with flipped Y coordinates
-                for entity_type, vertices, is_closed in all_vertices:
-                    if entity_type in ('POLYLINE', 'LWPOLYLINE') and len(vertices) > 1:
-                        # Flip Y coordinates (max_y + min_y - y will flip around the center of the pattern)
-                        flipped_vertices = [(x, max_y + min_y - y) for x, y in vertices]
-
-                        # Start a new subpath if needed
-                        if not is_path_started:
-                            path.moveTo(flipped_vertices[0][0], flipped_vertices[0][1])
-                            is_path_started = True
-                        else:
-                            path.moveTo(flipped_vertices[0][0], flipped_vertices[0][1])
+                        continue
+                    vertices = np.array([(start[0], start[1]), (end[0], end[1])], dtype=np.float64)
+                    is_closed = False
+                else:
+                    continue
 
-                        # Add remaining vertices
-                        for vertex in flipped_vertices[1:]:
-                            path.lineTo(vertex[0], vertex[1])
+                entity_arrays.append(vertices)
+                closed_flags.append(is_closed)
 
-                        # Close the path if entity is closed
-                        if is_closed:
-                            path.closeSubpath()
+            # Blocks without line geometry produce no pattern
+            if not entity_arrays:
+                continue
 
-                    elif entity_type == 'LINE':
-                        start, end = vertices
-                        # Flip Y coordinates
-                        start_flipped = (start[0], max_y + min_y - start[1])
-                        end_flipped = (end[0], max_y + min_y - end[1])
+            # Pack the block into one contiguous array so the bounds, the
+            # geometry digest and the flip each run once per block
+            lengths = [len(vertices) for vertices in entity_arrays]
+            block_vertices = np.concatenate(entity_arrays)
+
+            # Blocks repeating the same geometry share one path; QPainterPath
+            # is implicitly shared, so reusing it costs nothing
+            digest = hashlib.blake2b(bytes(closed_flags))
+            digest.update(np.asarray(lengths, dtype=np.int64).tobytes())
+            digest.update(block_vertices.tobytes())
+            geometry_key = digest.digest()
+
+            cached_path = path_cache.get(geometry_key)
+            if cached_path is not None:
+                pattern_paths.append(cached_path)
+                pattern_colors.append(color)
+                continue
 
-                        if not is_path_started:
-                            path.moveTo(start_flipped[0], start_flipped[1])
-                            is_path_started = True
-                        else:
-                            path.moveTo(start_flipped[0], start_flipped[1])
+            # Flip Y coordinates in place (max_y + min_y - y will flip around the center of the pattern)
+            ys = block_vertices[:, 1]
+            ys[:] = (ys.max() + ys.min()) - ys
 
-                        path.lineTo(end_flipped[0], end_flipped[1])
+            path.reserve(len(block_vertices))
 
-                # Add the path to our collection if it contains data
-                if not path.isEmpty():
-                    self.pattern_paths.append(path)
-                    self.pattern_colors.append(color)
-            else:
-                # No valid geometry found, try legacy approach (shouldn't happen often)
-                path = QPainterPath()
-                is_path_started = False
-
-                # Process entities in the block
-                for entity in block:
-                    entity_type = entity.dxftype()
-
-                    if entity_type in ('POLYLINE', 'LWPOLYLINE'):
-                        # Extract vertices
-                        vertices = self.extract_vertices(entity)
-
-                        if vertices and len(vertices) > 1:
-                            # Start a new subpath if needed
-                            if not is_path_started:
-                                path.moveTo(vertices[0][0], vertices[0][1])
-                                is_path_started = True
-                            else:
-                                path.moveTo(vertices[0][0], vertices[0][1])
-
-                            # Add remaining vertices
-                            for vertex in vertices[1:]:
-                                path.lineTo(vertex[0], vertex[1])
-
-                            # Close the path if entity is closed
-                            if self.is_entity_closed(entity):
-                                path.closeSubpath()
-
-                    elif entity_type == 'LINE':
-                        try:
-                            start = entity.dxf.start
-                            end = entity.dxf.end
-
-                            if not is_path_started:
-                                path.moveTo(start[0], start[1])
-                                is_path_started = True
-                            else:
-                                path.moveTo(start[0], start[1])
-
-                            path.lineTo(end[0], end[1])
-                        except:
-                            pass
-
-                # Add the path to our collection if it contains data
-                if not path.isEmpty():
-                    self.pattern_paths.append(path)
-                    self.pattern_colors.append(color)
+            # Create the path from per-entity views of the flipped array
+            entity_views = np.split(block_vertices, np.cumsum(lengths)[:-1])
+            for vertices, is_closed in zip(entity_views, closed_flags):
+                if len(vertices) < 2:
+                    continue
+
+                # Each entity becomes its own subpath
+                path.addPolygon(_array_to_polygon(vertices))
+
+                # Close the path if entity is closed
+                if is_closed:
+                    path.closeSubpath()
+
+            # Add the path to our collection if it contains data
+            if not path.isEmpty():
+                path_cache[geometry_key] = path
+                pattern_paths.append(path)
+                pattern_colors.append(color)
 
         # Process direct entities
-        for i, entity in enumerate(self.entities):
-            color = colors[(i + len(self.blocks)) % len(colors)]
+        for i, entity in enumerate(entities):
+            color = colors[(i + len(blocks)) % len(colors)]
             entity_type = entity.dxftype()
 
             if entity_type in ('POLYLINE', 'LWPOLYLINE'):
                 path = QPainterPath()
                 vertices = self.extract_vertices(entity)
 
-                if vertices and len(vertices) > 1:
-                    # Calculate min/max Y for flipping
-                    min_y = min(y for _, y in vertices)
-                    max_y = max(y for _, y in vertices)
-
-                    # Flip Y coordinates
-                    flipped_vertices = [(x, max_y + min_y - y) for x, y in vertices]
+                if len(vertices) > 1:
+                    # Flip Y coordinates around the center of the entity
+                    ys = vertices[:, 1]
+                    ys[:] = (ys.max() + ys.min()) - ys
 
-                    path.moveTo(flipped_vertices[0][0], flipped_vertices[0][1])
-
-                    for vertex in flipped_vertices[1:]:
-                        path.lineTo(vertex[0], vertex[1])
+                    path.addPolygon(_array_to_polygon(vertices))
 
                     if self.is_entity_closed(entity):
                         path.closeSubpath()
 
-                    self.pattern_paths.append(path)
-                    self.pattern_colors.append(color)
+                    pattern_paths.append(path)
+                    pattern_colors.append(color)
 
             elif entity_type == 'LINE':
                 try:
@@ -631,11 +919,13 @@ class PatternNestingApp(QMainWindow):
                     path.moveTo(start_flipped[0], start_flipped[1])
                     path.lineTo(end_flipped[0], end_flipped[1])
 
-                    self.pattern_paths.append(path)
-                    self.pattern_colors.append(color)
+                    pattern_paths.append(path)
+                    pattern_colors.append(color)
                 except:
                     pass
 
+        return pattern_paths, pattern_colors
+
     def extract_vertices(self, entity):
         """
         Extract vertices from a POLYLINE or LWPOLYLINE entity
@@ -644,69 +934,26 @@ class PatternNestingApp(QMainWindow):
             entity: DXF entity
             
         Returns:
-            list: List of (x, y) vertex coordinates
+            numpy.ndarray: (N, 2) float64 array of vertex coordinates
         """
-        vertices = []
         try:
-            # For LWPOLYLINE
-            if entity.dxftype() == 'LWPOLYLINE':
-                if hasattr(entity, 'vertices'):
-                    if callable(entity.vertices):
-                        try:
-                            points = list(entity.vertices())
-                        except:
-                            points = []
-                    else:
-                        points = entity.vertices
-                elif hasattr(entity, 'points'):
-                    points = entity.points
-                else:
-                    # Try to get vertices through DXF properties
-                    try:
-                        points = list(entity.get_points()) if hasattr(entity, 'get_points') else []
-                    except:
-                        points = []
-
-                # Process points
-                for point in points:
-                    if isinstance(point, (list, tuple)) and len(point) >= 2:
-                        vertices.append((point[0], point[1]))
-                    elif hasattr(point, 'x') and hasattr(point, 'y'):
-                        vertices.append((point.x, point.y))
-
-            # For POLYLINE
-            elif entity.dxftype() == 'POLYLINE':
-                if hasattr(entity, 'vertices'):
-                    if callable(entity.vertices):
-                        try:
-                            points = list(entity.vertices())
-                        except:
-                            points = []
-                    else:
-                        points = entity.vertices
-                else:
-                    # Try to get vertices through child entities
-                    points = []
-                    try:
-                        for vertex_entity in entity.virtual_entities():
-                            if vertex_entity.dxftype() == 'VERTEX':
-                                points.append(vertex_entity)
-                    except:
-                        pass
-
-                # Process points
-                for point in points:
-                    if isinstance(point, (list, tuple)) and len(point) >= 2:
-                        vertices.append((point[0], point[1]))
-                    elif hasattr(point, 'x') and hasattr(point, 'y'):
-                        vertices.append((point.x, point.y))
-                    elif hasattr(point, 'dxf') and hasattr(point.dxf, 'location'):
-                        loc = point.dxf.location
-                        vertices.append((loc.x, loc.y))
+            entity_type = entity.dxftype()
+            if entity_type == 'LWPOLYLINE':
+                # Only the x/y part of each point is requested
+                return np.array(entity.get_points('xy'), dtype=np.float64).reshape(-1, 2)
+            elif entity_type == 'POLYLINE':
+                # Fill the array straight from the vertex locations
+                count = len(entity.vertices)
+                coordinates = np.fromiter(
+                    (value for vertex in entity.vertices
+                     for value in (vertex.dxf.location.x, vertex.dxf.location.y)),
+                    dtype=np.float64, count=count * 2
+                )
+                return coordinates.reshape(-1, 2)
         except Exception as e:
             print(f"Error extracting vertices: {e}")
 
-        return vertices
+        return np.empty((0, 2), dtype=np.float64)
 
     def is_entity_closed(self, entity):
         """
@@ -718,87 +965,83 @@ class PatternNestingApp(QMainWindow):
         Returns:
             bool: True if entity is closed, False otherwise
         """
-        if hasattr(entity, 'is_closed'):
-            return entity.is_closed
-        elif hasattr(entity, 'closed'):
-            return entity.closed
-        elif hasattr(entity, 'dxf') and hasattr(entity.dxf, 'flags'):
-            # Check flags for closed polyline (flag 1 = closed)
+        # Both polyline types keep the closed state in their flags (flag 1 = closed)
+        if entity.dxftype() in ('POLYLINE', 'LWPOLYLINE'):
             return bool(entity.dxf.flags & 1)
         return False
 
-    def add_grid_to_scene(self, scene):
-        """
-        Add a reference grid to the given scene
-        
-        Args:
-            scene: QGraphicsScene to add grid to
-        """
-        grid_size = 10  # Grid cell size (integer)
-        grid_extent = 1000
-
-        # Create light gray dotted lines for grid
-        pen = QPen(Qt.lightGray)
-        pen.setStyle(Qt.DotLine)
-        pen.setWidthF(0.5)
-
-        # Horizontal lines
-        for y in range(0, grid_extent, grid_size):
-            scene.addLine(0, y, grid_extent, y, pen)
-
-        # Vertical lines
-        for x in range(0, grid_extent, grid_size):
-            scene.addLine(x, 0, x, grid_extent, pen)
-
-        # Add stronger lines for main axes
-        pen = QPen(Qt.darkGray)
-        pen.setStyle(Qt.SolidLine)
-        pen.setWidthF(1.0)
-
-        # Main horizontal and vertical lines
-        scene.addLine(0, 0, grid_extent, 0, pen)  # X-axis
-        scene.addLine(0, 0, 0, grid_extent, pen)  # Y-axis
-
     def populate_table(self):
         """Populate the table with pattern information"""
         total_items = len(self.pattern_paths)
 
+        # Fill the table with repaints, sorting and header resizing suspended,
+        # so the rows are laid out once instead of after every cell
+        # and no itemChanged signal is emitted for the cells being created
+        table = self.pattern_table
+        header = table.horizontalHeader()
+        sorting_enabled = table.isSortingEnabled()
+        resize_modes = [header.sectionResizeMode(column) for column in range(header.count())]
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        try:
+            self._fill_pattern_table(total_items)
+        finally:
+            for column, mode in enumerate(resize_modes):
+                header.setSectionResizeMode(column, mode)
+            table.setSortingEnabled(sorting_enabled)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _fill_pattern_table(self, total_items):
+        """
+        Fill the pattern table rows
+
+        Args:
+            total_items: Number of patterns to list
+        """
         # Update table columns to include preview
         self.pattern_table.setColumnCount(5)
         self.pattern_table.setHorizontalHeaderLabels(["ID", "Name", "Preview", "Area", "Perimeter"])
+
+        # Size every row to accommodate previews
+        self.pattern_table.verticalHeader().setDefaultSectionSize(62)  # Fixed row height
         self.pattern_table.setRowCount(total_items)
 
-        # Set row heights to accommodate previews
-        for i in range(total_items):
-            self.pattern_table.setRowHeight(i, 62)  # Fixed row height
+        self.pattern_table.setIconSize(QSize(PREVIEW_SIZE, PREVIEW_SIZE))
+        thumbnails = {}
+        # Thumbnails are rendered at the screen's pixel density so they stay sharp
+        pixel_ratio = self.pattern_table.devicePixelRatioF()
 
         # Add patterns to table
         for i, pattern_path in enumerate(self.pattern_paths):
             color = self.pattern_colors[i]
 
             # Get pattern metrics
-            area, perimeter = self.calculate_pattern_metrics(pattern_path)
+            area, perimeter = self.calculate_pattern_metrics(i)
 
             # Get block name
             block_name = ""
             if i < len(self.blocks):
-                block_name = self.get_block_name(self.blocks[i])
+                block_name = self._block_names.get(id(self.blocks[i]), "")
 
             # Add to table
             self.pattern_table.setItem(i, 0, QTableWidgetItem(str(i)))
             self.pattern_table.setItem(i, 1, QTableWidgetItem(str(i)))
 
-            # Create preview widget with container to ensure proper sizing
-            preview_container = QWidget()
-            preview_layout = QVBoxLayout(preview_container)
-            preview_layout.setContentsMargins(1, 1, 1, 1)  # Minimal margins
-            preview_layout.setAlignment(Qt.AlignCenter)  # Center the preview in the cell
-
-            preview = PatternPreviewWidget()
-            preview.set_pattern(pattern_path, color)
-
-            preview_layout.addWidget(preview)
-            self.pattern_table.setCellWidget(i, 2, preview_container)
+            # Show the preview as a pixmap in a plain item instead of a cell
+            # widget; patterns sharing a path and color share the thumbnail
+            thumbnail_key = (id(pattern_path), QColor(color).rgba())
+            thumbnail = thumbnails.get(thumbnail_key)
+            if thumbnail is None:
+                thumbnail = render_pattern_thumbnail(
+                    pattern_path, color, bounds=self._pattern_bounds[i], pixel_ratio=pixel_ratio
+                )
+                thumbnails[thumbnail_key] = thumbnail
+            preview_item = QTableWidgetItem()
+            preview_item.setData(Qt.DecorationRole, thumbnail)
+            self.pattern_table.setItem(i, 2, preview_item)
 
             # Add area and perimeter
             self.pattern_table.setItem(i, 3, QTableWidgetItem(f"{area:.2f} cm²"))
@@ -813,53 +1056,57 @@ class PatternNestingApp(QMainWindow):
         self.pattern_table.resizeColumnToContents(3)  # Area column
         self.pattern_table.resizeColumnToContents(4)  # Perimeter column
 
-    def calculate_pattern_metrics(self, path):
+    def calculate_pattern_metrics(self, index):
         """
-        Calculate area and perimeter of a pattern path
+        Calculate area and perimeter of a loaded pattern
+
+        Results are cached per path object for the lifetime of the loaded
+        patterns, so patterns sharing a path are only measured once.
         
         Args:
-            path: QPainterPath object
+            index: Index of the pattern in self.pattern_paths
             
+        Returns:
+            tuple: (area, perimeter) of the pattern
+        """
+        path = self.pattern_paths[index]
+        key = id(path)
+        metrics = self._metric_cache.get(key)
+        if metrics is None:
+            xs, ys = self.pattern_vertices[index]
+            metrics = self._compute_pattern_metrics(xs, ys, self._pattern_bounds[index])
+            self._metric_cache[key] = metrics
+        return metrics
+
+    def _compute_pattern_metrics(self, xs, ys, bounds):
+        """
+        Compute area and perimeter of a pattern
+
+        Args:
+            xs: Array of the pattern's x coordinates
+            ys: Array of the pattern's y coordinates
+            bounds: Bounding rect of the pattern path, used for the fallback
+
         Returns:
             tuple: (area, perimeter) of the pattern
         """
         try:
-            # Extract points from the path
-            polygon_points = []
-            path_elements = path.elementCount()
-
-            for i in range(path_elements):
-                element = path.elementAt(i)
-                if element.type == QPainterPath.MoveToElement or element.type == QPainterPath.LineToElement:
-                    polygon_points.append((element.x, element.y))
-
-            # Calculate perimeter
-            perimeter = 0
-            if len(polygon_points) > 1:
-                for i in range(len(polygon_points)):
-                    next_i = (i + 1) % len(polygon_points)
-                    x1, y1 = polygon_points[i]
-                    x2, y2 = polygon_points[next_i]
-
-                    # Calculate distance between points
-                    dist = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-                    perimeter += dist
-
-            # Calculate area using Shoelace formula
-            area = 0
-            if len(polygon_points) > 2:
-                for i in range(len(polygon_points)):
-                    next_i = (i + 1) % len(polygon_points)
-                    x1, y1 = polygon_points[i]
-                    x2, y2 = polygon_points[next_i]
-
-                    area += x1 * y2 - x2 * y1
-
-                area = abs(area) / 2.0
+            if len(xs) < _LOOP_METRICS_MAX_POINTS:
+                # NumPy call overhead outweighs the work on small patterns
+                area, perimeter = _loop_metrics(xs, ys)
+            else:
+                # Shift once; both the perimeter and the area use the next vertex
+                xs_next = np.roll(xs, -1)
+                ys_next = np.roll(ys, -1)
+
+                # Calculate perimeter, including the edge back to the first point
+                perimeter = float(np.hypot(xs_next - xs, ys_next - ys).sum())
+
+                # Calculate area using Shoelace formula
+                area = abs(float(np.dot(xs, ys_next) - np.dot(ys, xs_next))) / 2.0
 
             # If area calculation fails, use bounding rect approximation
             if area == 0:
-                bounds = path.boundingRect()
                 area = bounds.width() * bounds.height() * 0.8  # Approximate area
                 perimeter = 2 * (bounds.width() + bounds.height())  # Approximate perimeter
 
@@ -868,7 +1115,6 @@ class PatternNestingApp(QMainWindow):
         except Exception as e:
             print(f"Error calculating metrics: {e}")
             # Fall back to bounding rectangle approximation
-            bounds = path.boundingRect()
             area = bounds.width() * bounds.height() * 0.8  # Approximate area
             perimeter = 2 * (bounds.width() + bounds.height())  # Approximate perimeter
 
@@ -884,16 +1130,30 @@ class PatternNestingApp(QMainWindow):
         Returns:
             str: Name of the block
         """
-        for entity in block:
-            if entity.dxftype() == 'TEXT':
-                try:
-                    text = entity.dxf.text
-                    if text.startswith('NAME:'):
-                        return text.split(':')[1]
-                except:
-                    pass
+        # Let ezdxf filter the TEXT entities instead of checking each type here
+        for entity in block.query('TEXT'):
+            try:
+                text = entity.dxf.text
+                if text.startswith('NAME:'):
+                    return text.split(':', 1)[1]
+            except:
+                pass
         return block.name
 
+    def _dxf_location(self):
+        """
+        Get the directory and base name of the loaded DXF file
+
+        The path is only split again when a different file is loaded.
+
+        Returns:
+            tuple: (directory, file name without extension)
+        """
+        if self._dxf_meta is None or self._dxf_meta[0] != self.dxf_file_path:
+            dxf = Path(self.dxf_file_path)
+            self._dxf_meta = (self.dxf_file_path, str(dxf.parent), dxf.stem)
+        return self._dxf_meta[1], self._dxf_meta[2]
+
     def generate_wrk_file(self):
         """Generate a WRK file for the nesting program"""
         if not self.dxf_file_path:
@@ -911,7 +1171,7 @@ class PatternNestingApp(QMainWindow):
                 f.write("NESTING-WORK-FILE\n")
 
                 # Get directory paths
-                dxf_dir = os.path.dirname(self.dxf_file_path)
+                dxf_dir, dxf_basename = self._dxf_location()
                 wrk_dir = os.path.dirname(self.wrk_file_path)
 
                 # Write file paths
@@ -922,9 +1182,6 @@ class PatternNestingApp(QMainWindow):
                 f.write(f"MARKER_FILE_DIRECTORY  {wrk_dir}\n")
                 f.write(f"SESSION_FILE_DIRECTORY {wrk_dir}\n")
 
-                # Get the filename without extension
-                dxf_basename = os.path.splitext(os.path.basename(self.dxf_file_path))[0]
-
                 # Add marker file section
                 f.write("BEGIN_MARKER_FILE\n")
                 f.write(f"{dxf_basename}.dat\n")
@@ -993,11 +1250,11 @@ class PatternNestingApp(QMainWindow):
             layout.addWidget(time_label)
 
             # Add info text area
-            info_text = QLabel("Preparing to run nesting program...\n")
-            info_text.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            info_text.setWordWrap(True)
+            info_text = QPlainTextEdit()
+            info_text.setReadOnly(True)
             info_text.setMinimumHeight(100)
-            info_text.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+            info_text.setMaximumBlockCount(1000)  # Drop the oldest output lines on long runs
+            info_text.setPlainText("Preparing to run nesting program...")
             layout.addWidget(info_text)
 
             # Add button box
@@ -1014,7 +1271,7 @@ class PatternNestingApp(QMainWindow):
 
             # Initialize timer for tracking elapsed time
             start_time = time.time()
-            update_timer = QTimer()
+            update_timer = QTimer(progress_dialog)
 
             # Flag to track if process was stopped by user
             user_cancelled = [False]
@@ -1041,26 +1298,13 @@ class PatternNestingApp(QMainWindow):
 
                 progress_bar.setValue(progress_value)
 
-                # Keep UI responsive
-                QApplication.processEvents()
-
             # Setup timer
             update_timer.timeout.connect(update_progress)
             update_timer.start(500)  # Update every half second
 
-            # Connect stop button
-            def on_cancel():
-                user_cancelled[0] = True
-                status_label.setText("Stopping nesting process...")
-                if process and process.poll() is None:
-                    process.terminate()
-
-            stop_button.clicked.connect(on_cancel)
-
             # Update status message
             status_label.setText("Starting nesting program...")
-            info_text.setText(info_text.text() + "Launching nesting program...\n")
-            QApplication.processEvents()
+            info_text.appendPlainText("Launching nesting program...")
 
             # Run the nesting program with the WRK file as an argument
             nesting_program = os.path.abspath(self.nesting_program_path)
@@ -1071,119 +1315,166 @@ class PatternNestingApp(QMainWindow):
 
             # Update status
             status_label.setText("Running nesting algorithm...")
-            info_text.setText(info_text.text() + f"Processing file: {os.path.basename(wrk_file)}\n")
-            info_text.setText(info_text.text() + f"Parameter - Width: {self.width_spin.value()} cm\n")
-            info_text.setText(info_text.text() + f"Parameter - Min Efficiency: {self.efficiency_spin.value()}%\n")
-            info_text.setText(info_text.text() + f"Parameter - Time Limit: {self.time_spin.value()} min\n")
-            QApplication.processEvents()
-
-            # Create process
-            import platform
-            if platform.system() == 'Windows':
-                process = subprocess.Popen(
-                    [nesting_program, wrk_file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=program_dir,
-                    shell=True
-                )
-            else:
-                process = subprocess.Popen(
-                    [nesting_program, wrk_file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=program_dir
-                )
+            info_text.appendPlainText(
+                f"Processing file: {os.path.basename(wrk_file)}\n"
+                f"Parameter - Width: {self.width_spin.value()} cm\n"
+                f"Parameter - Min Efficiency: {self.efficiency_spin.value()}%\n"
+                f"Parameter - Time Limit: {self.time_spin.value()} min"
+            )
 
-            # Update status
-            status_label.setText("Nesting in progress...")
-            info_text.setText(info_text.text() + "Calculating optimal pattern layout...\n")
-            QApplication.processEvents()
+            # Create process; its signals drive the dialog from the event loop
+            process = QProcess(self)
+            process.setWorkingDirectory(program_dir)
+            process.setProgram(nesting_program)
+            process.setArguments([wrk_file])
+
+            def on_output():
+                """Show complete lines of program output as they arrive"""
+                # QProcess holds back a partial line until the rest is read
+                while process.canReadLine():
+                    line = bytes(process.readLine()).decode(errors='replace').rstrip()
+                    if line:
+                        info_text.appendPlainText(line)
+
+            # Only the tail of the error output is kept for the failure report
+            stderr_tail = [b'']
+
+            def on_error_output():
+                """Keep the last 4 KB of the program's error output"""
+                stderr_tail[0] = (stderr_tail[0] + bytes(process.readAllStandardError()))[-4096:]
+
+            # Set once the process is done and scheduled for deletion; it
+            # must not be touched after that
+            process_done = [False]
+
+            def release_process():
+                """Mark the process as done and schedule its deletion"""
+                process_done[0] = True
+                progress_dialog.rejected.disconnect(on_cancel)
+                process.deleteLater()
+
+            def kill_if_running():
+                """Force the program down if it ignored the terminate request"""
+                if not process_done[0] and process.state() != QProcess.NotRunning:
+                    process.kill()
 
-            # Wait for process to complete with progress updates
-            while process.poll() is None:
-                update_progress()
-                # Check if dialog has been closed
-                if not progress_dialog.isVisible() or user_cancelled[0]:
-                    process.terminate()
-                    break
-                time.sleep(0.1)
-
-            # Stop timer
-            update_timer.stop()
-
-            # Process has completed, check result
-            return_code = process.poll()
-            stdout, stderr = process.communicate()
-
-            # Calculate final time
-            elapsed = time.time() - start_time
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-
-            if user_cancelled[0]:
-                status_label.setText("Nesting process cancelled")
-                info_text.setText(info_text.text() + f"Process cancelled after {minutes}:{seconds:02d}\n")
+            def on_cancel():
+                """Stop the nesting program when the dialog is closed"""
+                if process_done[0] or process.state() == QProcess.NotRunning:
+                    return
+                user_cancelled[0] = True
+                status_label.setText("Stopping nesting process...")
+                process.terminate()
+                QTimer.singleShot(3000, kill_if_running)
+
+            def on_error(error):
+                """Report a program that could not be started"""
+                if error != QProcess.FailedToStart:
+                    return
+                update_timer.stop()
                 progress_dialog.hide()
-                self.statusBar.showMessage("Nesting program cancelled by user")
-                return
+                release_process()
+                QMessageBox.critical(self, "Error", f"Failed to run nesting program: {process.errorString()}")
+                self.statusBar.showMessage("Error running nesting program")
 
-            if return_code == 0:
-                # Success
-                progress_bar.setValue(100)
-                status_label.setText("Nesting completed successfully!")
-                info_text.setText(info_text.text() + f"Finished in {minutes}:{seconds:02d}\n")
-                QApplication.processEvents()
-
-                # Check if SES file was generated
-                dxf_basename = os.path.splitext(os.path.basename(self.dxf_file_path))[0]
-                dxf_dir = os.path.dirname(self.dxf_file_path)
-                ses_file = os.path.join(dxf_dir, f"{dxf_basename}.ses")
+            def on_finished(return_code, exit_status):
+                """Check the result once the nesting program exits"""
+                # Stop timer
+                update_timer.stop()
+                release_process()
 
-                if os.path.exists(ses_file):
-                    info_text.setText(info_text.text() + f"Generated result file: {os.path.basename(ses_file)}\n")
-
-                    # Parse the SES file to get efficiency
-                    nesting_data = parse_ses_file(ses_file)
-                    if nesting_data and 'marker_info' in nesting_data and 'efficiency' in nesting_data['marker_info']:
-                        efficiency = nesting_data['marker_info']['efficiency'] * 100
-                        info_text.setText(info_text.text() + f"Achieved efficiency: {efficiency:.2f}%\n")
-
-                    # Auto-close dialog after 3 seconds on success
-                    QTimer.singleShot(3000, progress_dialog.accept)
-
-                    # Ask if user wants to view results
-                    response = QMessageBox.question(
-                        self, "Nesting Complete",
-                        f"Nesting completed successfully!\nEfficiency: {efficiency:.2f}%\n\nWould you like to view the results?",
-                        QMessageBox.Yes | QMessageBox.No
-                    )
-
-                    if response == QMessageBox.Yes:
-                        # Parse and display the nesting result
-                        if nesting_data:
-                            self.display_nesting_result(nesting_data)
+                try:
+                    # Show a last output line that had no line break
+                    output = bytes(process.readAllStandardOutput()).decode(errors='replace').rstrip()
+                    if output:
+                        info_text.appendPlainText(output)
+
+                    on_error_output()
+                    stderr = stderr_tail[0].decode(errors='replace')
+
+                    # Calculate final time
+                    elapsed = time.time() - start_time
+                    minutes = int(elapsed) // 60
+                    seconds = int(elapsed) % 60
+
+                    if user_cancelled[0]:
+                        status_label.setText("Nesting process cancelled")
+                        info_text.appendPlainText(f"Process cancelled after {minutes}:{seconds:02d}")
+                        progress_dialog.hide()
+                        self.statusBar.showMessage("Nesting program cancelled by user")
+                        return
+
+                    if exit_status == QProcess.NormalExit and return_code == 0:
+                        # Success
+                        progress_bar.setValue(100)
+                        status_label.setText("Nesting completed successfully!")
+                        info_text.appendPlainText(f"Finished in {minutes}:{seconds:02d}")
+
+                        # Check if SES file was generated
+                        dxf_dir, dxf_basename = self._dxf_location()
+                        ses_file = os.path.join(dxf_dir, f"{dxf_basename}.ses")
+
+                        if os.path.exists(ses_file):
+                            info_text.appendPlainText(f"Generated result file: {os.path.basename(ses_file)}")
+
+                            # Parse the SES file to get efficiency
+                            nesting_data = parse_ses_file(ses_file)
+                            if nesting_data and 'marker_info' in nesting_data and 'efficiency' in nesting_data['marker_info']:
+                                efficiency = nesting_data['marker_info']['efficiency'] * 100
+                                info_text.appendPlainText(f"Achieved efficiency: {efficiency:.2f}%")
+
+                            # Auto-close dialog after 3 seconds on success
+                            QTimer.singleShot(3000, progress_dialog.accept)
+
+                            # Ask if user wants to view results
+                            response = QMessageBox.question(
+                                self, "Nesting Complete",
+                                f"Nesting completed successfully!\nEfficiency: {efficiency:.2f}%\n\nWould you like to view the results?",
+                                QMessageBox.Yes | QMessageBox.No
+                            )
+
+                            if response == QMessageBox.Yes:
+                                # Parse and display the nesting result
+                                if nesting_data:
+                                    self.display_nesting_result(nesting_data)
+                                else:
+                                    QMessageBox.warning(self, "Warning", "Failed to parse SES file.")
                         else:
-                            QMessageBox.warning(self, "Warning", "Failed to parse SES file.")
-                else:
-                    info_text.setText(info_text.text() + "Warning: No result file was generated.\n")
-                    # Keep dialog open longer if there's an issue
-                    QTimer.singleShot(5000, progress_dialog.accept)
+                            info_text.appendPlainText("Warning: No result file was generated.")
+                            # Keep dialog open longer if there's an issue
+                            QTimer.singleShot(5000, progress_dialog.accept)
 
-                self.statusBar.showMessage(f"Nesting completed successfully in {minutes}:{seconds:02d}")
+                        self.statusBar.showMessage(f"Nesting completed successfully in {minutes}:{seconds:02d}")
 
-            else:
-                # Error
-                status_label.setText("Nesting failed")
-                info_text.setText(info_text.text() + f"Process failed with error code {return_code}\n")
-                if stderr:
-                    info_text.setText(info_text.text() + f"Error: {stderr[:200]}...\n")
+                    else:
+                        # Error
+                        status_label.setText("Nesting failed")
+                        info_text.appendPlainText(f"Process failed with error code {return_code}")
+                        if stderr:
+                            info_text.appendPlainText(f"Error: ...{stderr[-200:]}")
+
+                        # Keep dialog open for error review
+                        QMessageBox.critical(self, "Error", f"Nesting program failed with error code {return_code}")
+                        self.statusBar.showMessage("Nesting program failed")
+
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    QMessageBox.critical(self, "Error", f"Failed to run nesting program: {str(e)}")
+                    self.statusBar.showMessage("Error running nesting program")
+
+            process.readyReadStandardOutput.connect(on_output)
+            process.readyReadStandardError.connect(on_error_output)
+            process.errorOccurred.connect(on_error)
+            process.finished.connect(on_finished)
+
+            # Closing the dialog or pressing Stop rejects it
+            progress_dialog.rejected.connect(on_cancel)
 
-                # Keep dialog open for error review
-                QMessageBox.critical(self, "Error", f"Nesting program failed with error code {return_code}")
-                self.statusBar.showMessage("Nesting program failed")
+            # Update status
+            status_label.setText("Nesting in progress...")
+            info_text.appendPlainText("Calculating optimal pattern layout...")
+            process.start()
 
         except Exception as e:
             import traceback
@@ -1226,12 +1517,13 @@ class PatternNestingApp(QMainWindow):
             return
 
         # Try to find SES file with the same name as the DXF file
-        ses_file = os.path.splitext(self.dxf_file_path)[0] + ".ses"
+        dxf_dir, dxf_basename = self._dxf_location()
+        ses_file = os.path.join(dxf_dir, f"{dxf_basename}.ses")
 
         # If SES file doesn't exist, ask user to select it
         if not os.path.exists(ses_file):
             file_path, _ = QFileDialog.getOpenFileName(
-                self, "Select SES File", os.path.dirname(self.dxf_file_path), "SES Files (*.ses)"
+                self, "Select SES File", dxf_dir, "SES Files (*.ses)"
             )
             if not file_path:
                 return
@@ -1256,99 +1548,113 @@ class PatternNestingApp(QMainWindow):
         # Clear previous display
         self.nesting_result_scene.clear()
 
-        # Add grid to scene for reference
-        self.add_grid_to_scene(self.nesting_result_scene)
-
-        # Get marker dimensions
-        marker_width = nesting_data['marker_info'].get('width', 150)
-        marker_length = nesting_data['marker_info'].get('length', 200)
-
-        # SWAP width and length for correct container display
-        display_width = marker_length  # Use length as width
-        display_height = marker_width  # Use width as height
-
-        # Create marker rectangle with black dashed outline
-        marker_pen = QPen(Qt.black, 1.0)
-        marker_pen.setStyle(Qt.DashLine)
-        self.nesting_result_scene.addRect(0, 0, display_width, display_height, marker_pen)
-
-        # Create dictionary mapping piece IDs to pattern paths
-        piece_paths = {}
-        piece_colors = {}
-        for i, path in enumerate(self.pattern_paths):
-            piece_paths[i] = path
-            piece_colors[i] = self.pattern_colors[i] if i < len(self.pattern_colors) else QColor(255, 80, 40)
-
-        # Place each piece at its position from the nesting data
-        for piece_info in nesting_data['pieces']:
-            piece_id = piece_info['id']
-
-            # Skip if piece not found in pattern paths
-            if piece_id not in piece_paths:
-                print(f"Warning: Piece ID {piece_id} not found in pattern paths")
-                continue
-
-            # Get the pattern path for this piece
-            pattern_path = piece_paths[piece_id]
+        # Build the scene unindexed and unpainted, then index it once
+        self.nesting_result_scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.nesting_result_view.setUpdatesEnabled(False)
+        try:
+            # Get marker dimensions
+            marker_width = nesting_data['marker_info'].get('width', 150)
+            marker_length = nesting_data['marker_info'].get('length', 200)
+
+            # SWAP width and length for correct container display
+            display_width = marker_length  # Use length as width
+            display_height = marker_width  # Use width as height
+
+            # Create marker rectangle with black dashed outline
+            marker_pen = QPen(Qt.black, 1.0)
+            marker_pen.setStyle(Qt.DashLine)
+            self.nesting_result_scene.addRect(0, 0, display_width, display_height, marker_pen)
+
+            # Create dictionary mapping piece IDs to pattern paths
+            piece_paths = {}
+            piece_colors = {}
+            for i, path in enumerate(self.pattern_paths):
+                piece_paths[i] = path
+                piece_colors[i] = self.pattern_colors[i] if i < len(self.pattern_colors) else QColor(255, 80, 40)
+
+            # Piece IDs are collected and drawn by a single overlay item
+            label_font = QFont("Arial", 12)
+            label_font.setBold(True)
+            labels = []
+
+            # (flip, angle) -> placement transform
+            transforms = {}
+
+            # Place each piece at its position from the nesting data
+            for piece_info in nesting_data['pieces']:
+                piece_id = piece_info.id
+
+                # Skip if piece not found in pattern paths
+                if piece_id not in piece_paths:
+                    print(f"Warning: Piece ID {piece_id} not found in pattern paths")
+                    continue
 
-            # Create a copy of the path to avoid modifying the original
-            path_copy = QPainterPath(pattern_path)
+                # Get the pattern path for this piece; items only transform it,
+                # so all pieces share the loaded path
+                pattern_path = piece_paths[piece_id]
+
+                # Use the original pattern color
+                color = piece_colors[piece_id]
+
+                # Create graphics item for the pattern - use pattern fill (Dense4Pattern) to match the Pattern Pieces view
+                path_item = PatternItem(pattern_path, self.pattern_pen(color), self.pattern_brush(color),
+                                        path_bounds=self._pattern_bounds[piece_id])
+                path_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+                # Apply flip and rotation with one transform shared by all
+                # pieces placed the same way
+                transform_key = (piece_info.flip, piece_info.angle)
+                transform = transforms.get(transform_key)
+                if transform is None:
+                    # The item rotation is applied before the item transform,
+                    # so the flip follows the rotation
+                    transform = QTransform().rotate(piece_info.angle)
+                    if piece_info.flip:
+                        transform = transform * QTransform.fromScale(-1, 1)  # Horizontal flip
+                    transforms[transform_key] = transform
+                path_item.setTransform(transform)
 
-            # Create graphics item for the pattern
-            path_item = QGraphicsPathItem(path_copy)
+                # Position the piece
+                path_item.setPos(piece_info.x, piece_info.y)
 
-            # Use the original pattern color
-            color = piece_colors[piece_id]
+                # Add piece ID as small text at center
+                bounds = path_item.boundingRect()
+                labels.append((
+                    piece_info.x + bounds.width() / 2,
+                    piece_info.y + bounds.height() / 2,
+                    str(piece_id)
+                ))
 
-            # Set pen and brush - use pattern fill (Dense4Pattern) to match the Pattern Pieces view
-            path_item.setPen(QPen(color, 0.5))
-            path_item.setBrush(QBrush(color, Qt.Dense4Pattern))  # Use pattern fill instead of solid
+                # Add to scene
+                self.nesting_result_scene.addItem(path_item)
 
-            # Apply flip if needed
-            if piece_info['flip']:
-                # Create a transform to flip the piece
-                transform = QTransform()
-                transform.scale(-1, 1)  # Horizontal flip
-                path_item.setTransform(transform)
+            self.nesting_result_scene.addItem(LabelOverlay(labels, label_font, QColor(Qt.black)))
 
-            # Apply rotation if needed
-            if piece_info['angle'] != 0:
-                path_item.setRotation(piece_info['angle'])
-
-            # Position the piece
-            path_item.setPos(piece_info['x'], piece_info['y'])
-
-            # Add piece ID as small text at center
-            bounds = path_item.boundingRect()
-            text_item = self.nesting_result_scene.addText(str(piece_id))
-            font = QFont("Arial", 12)
-            font.setBold(True)
-            text_item.setFont(font)
-            text_item.setDefaultTextColor(Qt.black)
-
-            # Position the text
-            text_width = text_item.boundingRect().width()
-            text_height = text_item.boundingRect().height()
-            text_item.setPos(
-                piece_info['x'] + bounds.width() / 2 - text_width / 2,
-                piece_info['y'] + bounds.height() / 2 - text_height / 2
+            # Set scene rectangle to contain all pieces, using swapped dimensions
+            self.nesting_result_scene.setSceneRect(
+                0, 0, display_width + 20, display_height + 50
             )
 
-            # Add to scene
-            self.nesting_result_scene.addItem(path_item)
+            # Add text for marker information at the bottom
+            efficiency = nesting_data['marker_info'].get('efficiency', 0) * 100
+            info_text = f"Width: {marker_width:.2f} cm, Length: {marker_length:.2f} cm, Efficiency: {efficiency:.2f}%"
+            text_item = self.nesting_result_scene.addText(info_text)
+            text_item.setPos(10, display_height + 10)
+            text_item.setFont(QFont("Arial", 10, QFont.Bold))
+        finally:
+            self.nesting_result_scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+            self.nesting_result_view.setUpdatesEnabled(True)
 
-        # Set scene rectangle to contain all pieces, using swapped dimensions
-        self.nesting_result_scene.setSceneRect(
-            0, 0, display_width + 20, display_height + 50
-        )
+        # Fit and show the view once the event loop has caught up
+        QTimer.singleShot(0, self.show_nesting_result_view)
 
-        # Add text for marker information at the bottom
-        efficiency = nesting_data['marker_info'].get('efficiency', 0) * 100
-        info_text = f"Width: {marker_width:.2f} cm, Length: {marker_length:.2f} cm, Efficiency: {efficiency:.2f}%"
-        text_item = self.nesting_result_scene.addText(info_text)
-        text_item.setPos(10, display_height + 10)
-        text_item.setFont(QFont("Arial", 10, QFont.Bold))
+        # Show success message
+        self.statusBar.showMessage(
+            f"Nesting result loaded. Efficiency: {efficiency:.2f}%"
+        )
 
+    def show_nesting_result_view(self):
+        """Fit the nesting result into its view and switch to its tab"""
         # Fit view to show all pieces
         self.nesting_result_view.fitInView(
             self.nesting_result_scene.sceneRect(), Qt.KeepAspectRatio
@@ -1357,10 +1663,20 @@ class PatternNestingApp(QMainWindow):
         # Switch to the nesting result tab
         self.right_panel.setCurrentWidget(self.nesting_result_view)
 
-        # Show success message
-        self.statusBar.showMessage(
-            f"Nesting result loaded. Efficiency: {efficiency:.2f}%"
-        )
+    def view_session_file_when_loaded(self, ses_file):
+        """
+        Show a session file once the DXF file being loaded is ready
+
+        The result is drawn with the loaded pattern pieces, so while a DXF
+        load is running it is shown when the load finishes.
+
+        Args:
+            ses_file: Path to SES file
+        """
+        if self._dxf_thread is not None:
+            self._pending_ses_file = ses_file
+        else:
+            self.view_session_file(ses_file)
 
     def view_session_file(self, ses_file):
         """
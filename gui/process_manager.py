@@ -3,21 +3,268 @@ Process manager window for managing nesting tasks.
 """
 import os
 import subprocess
+from functools import lru_cache
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableView, QHeaderView,
                              QStatusBar, QToolBar, QAction, QMenu, QMessageBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QMutex
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QColor
 
 from models.nesting_task import NestingTask
 from gui.dialogs.add_task_dialog import AddTaskDialog
 
 
+@lru_cache(maxsize=4096)
+def _format_mm_ss(total_seconds):
+    """
+    Format a duration as mm:ss
+
+    Time limits never change and progress times repeat across refreshes,
+    so the formatted strings are cached.
+
+    Args:
+        total_seconds (int): Duration in seconds
+
+    Returns:
+        str: Duration as mm:ss
+    """
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class NestingTaskModel(QAbstractTableModel):
+    """Table model showing a list of nesting tasks"""
+
+    HEADERS = [
+        "№", "Имя файла", "Статус", "Прогресс (мм:сс)",
+        "Время (мм:сс)", "Лекала", "Эффективность",
+        "Ширина", "Путь к файлу"
+    ]
+
+    # Status cell background colors, shared by every row
+    _STATUS_BG = {
+        NestingTask.STATUS_RUNNING: QColor(173, 216, 230),  # Light blue
+        NestingTask.STATUS_COMPLETED: QColor(144, 238, 144),  # Light green
+        NestingTask.STATUS_STOPPED: QColor(255, 165, 0),  # Orange
+        NestingTask.STATUS_ERROR: QColor(255, 99, 71),  # Tomato red
+    }
+
+    def __init__(self, tasks, parent=None):
+        """
+        Initialize the task model
+
+        The text of every row is kept between refreshes, so painting only
+        reads strings and a refresh only announces the cells whose text
+        actually changed.
+
+        Args:
+            tasks: List of NestingTask objects, shared with the process manager
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.tasks = tasks
+        self._row_texts = [self.row_texts(row, task) for row, task in enumerate(tasks)]
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Get the number of rows
+
+        Args:
+            parent: Parent index
+
+        Returns:
+            int: Number of tasks
+        """
+        if parent.isValid():
+            return 0
+        return len(self.tasks)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Get the number of columns
+
+        Args:
+            parent: Parent index
+
+        Returns:
+            int: Number of columns
+        """
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Get the header labels
+
+        Args:
+            section: Column or row number
+            orientation: Header orientation
+            role: Data role
+
+        Returns:
+            str or None: Column title
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Get the data of a cell
+
+        Args:
+            index: Cell index
+            role: Data role
+
+        Returns:
+            Cell text, status background color, the row's task for
+            Qt.UserRole or None
+        """
+        if not index.isValid() or index.row() >= len(self.tasks):
+            return None
+
+        texts = self._row_texts[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            return texts[column]
+
+        # Color by the status text shown, so both change in the same refresh
+        if role == Qt.BackgroundRole and column == 2:
+            return self._STATUS_BG.get(texts[2])
+
+        if role == Qt.UserRole:
+            return self.tasks[index.row()]
+
+        return None
+
+    def cell_text(self, row, task, column):
+        """
+        Format the text of a cell
+
+        Args:
+            row: Row of the task
+            task: NestingTask shown in the row
+            column: Column number
+
+        Returns:
+            str: Cell text
+        """
+        if column == 0:
+            # Task number
+            return str(row + 1)
+        if column == 1:
+            # Filename
+            return task.file_name
+        if column == 2:
+            # Status
+            return task.status
+        if column == 3:
+            # Progress time (mm:ss)
+            return _format_mm_ss(task.progress_time)
+        if column == 4:
+            # Time limit (mm:ss)
+            return _format_mm_ss(task.time_limit)
+        if column == 5:
+            # Pattern count
+            return str(task.pattern_count)
+        if column == 6:
+            # Efficiency
+            return f"{task.efficiency:.2f}%" if task.efficiency > 0 else ""
+        if column == 7:
+            # Width
+            return f"{task.width:.6f}"
+        # File path
+        return task.dxf_file
+
+    def row_texts(self, row, task):
+        """
+        Format the text of every cell of a row
+
+        Args:
+            row: Row of the task
+            task: NestingTask shown in the row
+
+        Returns:
+            list: Cell texts
+        """
+        return [self.cell_text(row, task, column) for column in range(len(self.HEADERS))]
+
+    def refresh(self, first_column=0, last_column=None, first_row=0, last_row=None):
+        """
+        Reformat cells of tasks and update the ones that changed
+
+        All changed cells are announced with a single dataChanged covering
+        them, so the view schedules one repaint per refresh.
+
+        Args:
+            first_column: First column to check
+            last_column: Last column to check, the last column if None
+            first_row: First row to check
+            last_row: Last row to check, the last row if None
+        """
+        if last_column is None:
+            last_column = len(self.HEADERS) - 1
+        if last_row is None:
+            last_row = len(self.tasks) - 1
+
+        changed_top = changed_bottom = None
+        changed_first = changed_last = None
+        for row in range(first_row, last_row + 1):
+            task = self.tasks[row]
+            texts = self._row_texts[row]
+            for column in range(first_column, last_column + 1):
+                text = self.cell_text(row, task, column)
+                if text != texts[column]:
+                    texts[column] = text
+                    if changed_top is None:
+                        changed_top = row
+                    changed_bottom = row
+                    if changed_first is None or column < changed_first:
+                        changed_first = column
+                    if changed_last is None or column > changed_last:
+                        changed_last = column
+
+        if changed_top is not None:
+            self.dataChanged.emit(
+                self.index(changed_top, changed_first),
+                self.index(changed_bottom, changed_last),
+                [Qt.DisplayRole, Qt.BackgroundRole]
+            )
+
+    def add_task(self, task):
+        """
+        Append a task as a new row
+
+        Args:
+            task: NestingTask to add
+        """
+        row = len(self.tasks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tasks.append(task)
+        self._row_texts.append(self.row_texts(row, task))
+        self.endInsertRows()
+
+    def remove_task(self, task):
+        """
+        Remove the row of a task
+
+        Args:
+            task: NestingTask to remove
+        """
+        row = self.tasks.index(task)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.tasks[row]
+        del self._row_texts[row]
+        self.endRemoveRows()
+
+
 class NestingProcessManager(QMainWindow):
     """Window for managing multiple nesting processes"""
 
     # Define a signal for task completion
-    task_completed_signal = pyqtSignal(int)  # Parameter is task index
+    task_completed_signal = pyqtSignal(int)  # Parameter is task id
 
     def __init__(self, parent=None):
         """
@@ -30,10 +277,10 @@ class NestingProcessManager(QMainWindow):
 
         self.tasks = []  # List of NestingTask objects
         self.nesting_program = ""  # Default nesting program path
-        self.task_mutex = QMutex()  # Add a mutex for thread safety
+        self._updating = False  # Set while update_task_status runs, to skip reentrant calls
         self.parent_app = parent  # Store reference to the parent app
-        self.last_selected_row = -1  # Track the last selected row
-        self.update_counter = 0  # Counter to limit full updates
+        self._task_states = {}  # Task id -> (status, pattern count, efficiency) last shown
+        self._dirty = False  # Set when task changes were not shown while hidden
 
         # Get nesting program from parent if available
         if parent and hasattr(parent, 'nesting_program_path'):
@@ -44,10 +291,9 @@ class NestingProcessManager(QMainWindow):
         # Connect the task completed signal
         self.task_completed_signal.connect(self.on_task_completed)
 
-        # Start the timer for updating task status
+        # Timer for updating task status; it only runs while the window is shown
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_task_status)
-        self.timer.start(1000)  # Update every second - reduced frequency
 
         # Setting this attribute to avoid destroying the window on close
         self.setAttribute(Qt.WA_DeleteOnClose, False)
@@ -67,6 +313,41 @@ class NestingProcessManager(QMainWindow):
             if self.parent_app and hasattr(self.parent_app, 'statusBar'):
                 self.parent_app.statusBar.showMessage("Nesting tasks continue running in the background", 3000)
 
+    def showEvent(self, event):
+        """
+        Catch up on changes made while hidden and resume updates
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if self._dirty:
+            self.update_task_table(force=True)
+            self._dirty = False
+        self.adjust_update_timer()
+
+    def hideEvent(self, event):
+        """
+        Stop updating the task table while nothing is shown
+
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.timer.stop()
+        if any(task.is_running for task in self.tasks):
+            self._dirty = True
+
+    def adjust_update_timer(self):
+        """Poll every second while a task runs, every 5 seconds when idle and not at all without tasks"""
+        if not self.tasks or not self.isVisible():
+            self.timer.stop()
+            return
+
+        interval = 1000 if any(task.is_running for task in self.tasks) else 5000
+        if not self.timer.isActive() or self.timer.interval() != interval:
+            self.timer.start(interval)
+
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("Диспетчер задач")
@@ -80,26 +361,20 @@ class NestingProcessManager(QMainWindow):
         # Create toolbar
         self.create_toolbar()
 
-        # Create task table
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(9)
-        self.task_table.setHorizontalHeaderLabels([
-            "№", "Имя файла", "Статус", "Прогресс (мм:сс)",
-            "Время (мм:сс)", "Лекала", "Эффективность",
-            "Ширина", "Путь к файлу"
-        ])
+        # Create task table; the view keeps the selection across model updates
+        self.model = NestingTaskModel(self.tasks, self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.model)
 
         # Set table properties
-        self.task_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.task_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.task_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.task_table.setSelectionBehavior(QTableView.SelectRows)
+        self.task_table.setSelectionMode(QTableView.SingleSelection)
+        self.task_table.setEditTriggers(QTableView.NoEditTriggers)
         self.task_table.setAlternatingRowColors(True)
         self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.task_table.horizontalHeader().setStretchLastSection(True)
         self.task_table.verticalHeader().setVisible(False)
-
-        # Connect selection changed signal to track selection
-        self.task_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.task_table.verticalScrollBar().valueChanged.connect(self.update_progress_display)
 
         # Set column widths
         self.task_table.setColumnWidth(0, 40)  # №
@@ -123,14 +398,6 @@ class NestingProcessManager(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Готово")
 
-    def on_selection_changed(self):
-        """Track when the selection changes"""
-        selected_rows = self.task_table.selectionModel().selectedRows()
-        if selected_rows:
-            self.last_selected_row = selected_rows[0].row()
-        else:
-            self.last_selected_row = -1
-
     def create_toolbar(self):
         """Create the toolbar with actions"""
         toolbar = QToolBar("Панель инструментов")
@@ -210,31 +477,35 @@ class NestingProcessManager(QMainWindow):
                 time_limit=dialog.time_limit
             )
 
-            # Monkey patch the _notify_task_completed method
-            task_index = len(self.tasks)
-            task._notify_task_completed = lambda: self.task_completed_signal.emit(task_index)
+            # Monkey patch the _notify_task_completed method; the id stays
+            # valid when earlier tasks are removed
+            task._notify_task_completed = lambda task_id=task.id: self.task_completed_signal.emit(task_id)
 
             # Add the task to the list
-            self.tasks.append(task)
-
-            # Update the table
-            self.update_task_table(force=True)
+            self.model.add_task(task)
 
             # Auto start if selected
             if dialog.auto_start:
                 task.start()
-                self.update_task_table(force=True)  # Update immediately
 
-    def on_task_completed(self, task_index):
+            # Update the table once, with the started state if any
+            self.update_task_table(force=True)
+
+            self.adjust_update_timer()
+
+    def on_task_completed(self, task_id):
         """
         Slot that's called when a task is completed
         
         Args:
-            task_index: Index of the completed task
+            task_id: Id of the completed task
         """
-        if 0 <= task_index < len(self.tasks):
+        task_index = next((i for i, task in enumerate(self.tasks) if task.id == task_id), -1)
+        if task_index >= 0:
             print(f"Task {task_index} completed, updating UI")
-            self.update_task_table(force=True)
+            # Only the completed task's row has changed
+            self.model.refresh(first_row=task_index, last_row=task_index)
+            self.adjust_update_timer()
             # Maybe show a notification or play a sound
             self.statusBar.showMessage(f"Task {task_index + 1} completed")
 
@@ -244,59 +515,60 @@ class NestingProcessManager(QMainWindow):
 
     def update_task_status(self):
         """Update the status of running tasks (called by timer)"""
-        # Use mutex to prevent concurrent access
-        self.task_mutex.lock()
+        if not self.isVisible():
+            self._dirty = True
+            return
+
+        # The timer only fires on the GUI thread; a nested event loop (such
+        # as a message box) is the only way to get back in here mid-update
+        if self._updating:
+            return
+        self._updating = True
         try:
-            # Check if any tasks need updating
-            needs_update = False
+            # A task's own thread blocks on the nesting program and wakes up
+            # at most once a second, so the progress times are brought up to
+            # date here; that only reads the clock and never waits on a task
             running_tasks = False
-
             for task in self.tasks:
                 if task.is_running:
-                    running_tasks = True
-                    # Update the task's progress
                     task.update_progress()
-                    needs_update = True
-
-            if needs_update and self.isVisible():
-                self.update_counter += 1
-                if running_tasks:
-                    # Update only progress times every second
-                    self.update_progress_display()
-
-                    # Do a full update every 5 seconds to ensure all data is fresh
-                    if self.update_counter >= 5:
-                        self.update_task_table(force=True)
-                        self.update_counter = 0
-                else:
-                    # If no running tasks, do normal update
-                    self.update_task_table(force=True)
-                    self.update_counter = 0
+                    running_tasks = True
+
+            if running_tasks:
+                # Update only progress times every second
+                self.update_progress_display()
+
+                # Reformat the other changing columns of a row only when one
+                # of the fields behind them has moved since the last tick
+                for row, task in enumerate(self.tasks):
+                    state = (task.status, task.pattern_count, task.efficiency)
+                    if self._task_states.get(task.id) != state:
+                        self._task_states[task.id] = state
+                        self.model.refresh(2, 6, row, row)
+
+            # Slow down once the last running task has finished
+            if not running_tasks:
+                self.adjust_update_timer()
 
         finally:
-            self.task_mutex.unlock()
+            self._updating = False
 
     def update_progress_display(self):
         """Update only the progress time display for running tasks without changing selection"""
-        if not self.isVisible() or self.task_table.rowCount() == 0:
+        if not self.isVisible() or not self.tasks:
             return
 
-        # Update only the progress column for running tasks
-        for row in range(self.task_table.rowCount()):
-            task_index = int(self.task_table.item(row, 0).text()) - 1
-            if 0 <= task_index < len(self.tasks):
-                task = self.tasks[task_index]
-
-                if task.is_running:
-                    # Update progress time
-                    minutes = task.progress_time // 60
-                    seconds = task.progress_time % 60
-                    progress_text = f"{minutes:02d}:{seconds:02d}"
-
-                    # Update only the progress cell
-                    progress_item = self.task_table.item(row, 3)
-                    if progress_item and progress_item.text() != progress_text:
-                        progress_item.setText(progress_text)
+        # Only the progress column changes between full updates, and only
+        # the rows in the viewport need it; rows scrolled into view are
+        # refreshed by the scroll bar
+        viewport = self.task_table.viewport()
+        top = self.task_table.indexAt(viewport.rect().topLeft()).row()
+        if top < 0:
+            return
+        bottom = self.task_table.indexAt(viewport.rect().bottomLeft()).row()
+        if bottom < 0:
+            bottom = self.model.rowCount() - 1
+        self.model.refresh(3, 3, top, bottom)
 
     def update_task_table(self, force=False):
         """
@@ -307,73 +579,11 @@ class NestingProcessManager(QMainWindow):
         """
         # Only update the table if the window is visible
         if not self.isVisible() and not force:
+            self._dirty = True
             return
 
-        # Save the current selection
-        current_row = self.last_selected_row
-
-        # Block signals temporarily to prevent selection change events during update
-        self.task_table.blockSignals(True)
-
-        # Clear the table
-        self.task_table.setRowCount(0)
-
-        # Add tasks to the table
-        for i, task in enumerate(self.tasks):
-            row = self.task_table.rowCount()
-            self.task_table.insertRow(row)
-
-            # Task number
-            self.task_table.setItem(row, 0, QTableWidgetItem(str(i + 1)))
-
-            # Filename
-            filename = os.path.basename(task.dxf_file)
-            self.task_table.setItem(row, 1, QTableWidgetItem(filename))
-
-            # Status
-            status_item = QTableWidgetItem(task.status)
-            if task.status == NestingTask.STATUS_RUNNING:
-                status_item.setBackground(QColor(173, 216, 230))  # Light blue
-            elif task.status == NestingTask.STATUS_COMPLETED:
-                status_item.setBackground(QColor(144, 238, 144))  # Light green
-            elif task.status == NestingTask.STATUS_STOPPED:
-                status_item.setBackground(QColor(255, 165, 0))  # Orange
-            elif task.status == NestingTask.STATUS_ERROR:
-                status_item.setBackground(QColor(255, 99, 71))  # Tomato red
-            self.task_table.setItem(row, 2, status_item)
-
-            # Progress time (mm:ss)
-            minutes = task.progress_time // 60
-            seconds = task.progress_time % 60
-            progress_text = f"{minutes:02d}:{seconds:02d}"
-            self.task_table.setItem(row, 3, QTableWidgetItem(progress_text))
-
-            # Time limit (mm:ss)
-            minutes = task.time_limit // 60
-            seconds = task.time_limit % 60
-            time_text = f"{minutes:02d}:{seconds:02d}"
-            self.task_table.setItem(row, 4, QTableWidgetItem(time_text))
-
-            # Pattern count
-            self.task_table.setItem(row, 5, QTableWidgetItem(str(task.pattern_count)))
-
-            # Efficiency
-            efficiency_text = f"{task.efficiency:.2f}%" if task.efficiency > 0 else ""
-            self.task_table.setItem(row, 6, QTableWidgetItem(efficiency_text))
-
-            # Width
-            self.task_table.setItem(row, 7, QTableWidgetItem(f"{task.width:.6f}"))
-
-            # File path
-            self.task_table.setItem(row, 8, QTableWidgetItem(task.dxf_file))
-
-        # Restore selection if possible
-        if current_row >= 0 and current_row < self.task_table.rowCount():
-            self.task_table.selectRow(current_row)
-            self.last_selected_row = current_row
-
-        # Unblock signals
-        self.task_table.blockSignals(False)
+        # The view pulls the new cell text for the rows it shows
+        self.model.refresh()
 
     def get_selected_task(self):
         """
@@ -387,13 +597,8 @@ class NestingProcessManager(QMainWindow):
             QMessageBox.warning(self, "Предупреждение", "Не выбрана задача")
             return None
 
-        row = selected_rows[0].row()
-        task_index = int(self.task_table.item(row, 0).text()) - 1
-
-        if 0 <= task_index < len(self.tasks):
-            return self.tasks[task_index]
-
-        return None
+        # The model hands out the task of a row, or None for a stale index
+        return selected_rows[0].data(Qt.UserRole)
 
     def start_selected_task(self):
         """Start the selected task"""
@@ -402,6 +607,7 @@ class NestingProcessManager(QMainWindow):
             print(f"Starting task: {task.dxf_file}")
             task.start()
             self.update_task_table(force=True)
+            self.adjust_update_timer()
 
     def stop_selected_task(self):
         """Stop the selected task"""
@@ -410,6 +616,7 @@ class NestingProcessManager(QMainWindow):
             print(f"Stopping task: {task.dxf_file}")
             task.stop()
             self.update_task_table(force=True)
+            self.adjust_update_timer()
 
     def remove_selected_task(self):
         """Remove the selected task"""
@@ -420,8 +627,10 @@ class NestingProcessManager(QMainWindow):
                 task.stop()
 
             # Remove from list
-            self.tasks.remove(task)
+            self.model.remove_task(task)
+            self._task_states.pop(task.id, None)
             self.update_task_table(force=True)
+            self.adjust_update_timer()
 
     def view_selected_result(self):
         """View the result of the selected task"""
@@ -435,13 +644,13 @@ class NestingProcessManager(QMainWindow):
             return
 
         # Check if SES file exists
-        ses_file = os.path.splitext(task.dxf_file)[0] + ".ses"
+        ses_file = task.ses_file
         if not os.path.exists(ses_file):
             QMessageBox.warning(self, "Предупреждение", "Файл результатов не найден")
             return
 
         # If parent app has the visualization functionality, use it
-        if self.parent_app and hasattr(self.parent_app, 'view_session_file'):
+        if self.parent_app and hasattr(self.parent_app, 'view_session_file_when_loaded'):
             # If parent app doesn't have DXF file loaded, try to load it first
             if not self.parent_app.dxf_file_path:
                 self.parent_app.dxf_file_path = task.dxf_file
@@ -451,8 +660,8 @@ class NestingProcessManager(QMainWindow):
                 except Exception as e:
                     print(f"Warning: Could not load DXF file in parent app: {e}")
 
-            # Now show the nesting result
-            self.parent_app.view_session_file(ses_file)
+            # Now show the nesting result, after the DXF load if one is running
+            self.parent_app.view_session_file_when_loaded(ses_file)
             self.parent_app.raise_()  # Bring the main window to the front
         else:
             # Fall back to opening the file with the default application
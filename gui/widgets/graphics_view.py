@@ -1,14 +1,38 @@
 """
 Graphics view widget for pattern visualization.
 """
-from PyQt5.QtWidgets import QGraphicsView
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter
+import math
+
+from PyQt5.QtWidgets import QGraphicsView, QOpenGLWidget
+from PyQt5.QtCore import Qt, QLineF, QTimer
+from PyQt5.QtGui import QPainter, QPen, QOpenGLContext
+
+
+_OPENGL_AVAILABLE = None
+
+
+def _opengl_available():
+    """
+    Check whether an OpenGL context can be created on this system
+
+    The result is computed once and reused by every view.
+
+    Returns:
+        bool: True if OpenGL rendering is available
+    """
+    global _OPENGL_AVAILABLE
+    if _OPENGL_AVAILABLE is None:
+        _OPENGL_AVAILABLE = QOpenGLContext().create()
+    return _OPENGL_AVAILABLE
 
 
 class PatternGraphicsView(QGraphicsView):
     """Custom QGraphicsView with enhanced zooming and navigation"""
 
+    # Reference grid drawn behind the scene, in scene units
+    GRID_SIZE = 10
+    GRID_EXTENT = 1000
+
     def __init__(self, parent=None):
         """
         Initialize the graphics view
@@ -17,6 +41,12 @@ class PatternGraphicsView(QGraphicsView):
             parent: Parent widget
         """
         super().__init__(parent)
+
+        # Render paths on the GPU when OpenGL is available
+        use_opengl = _opengl_available()
+        if use_opengl:
+            self.setViewport(QOpenGLWidget())
+
         self.setRenderHint(QPainter.Antialiasing)
 
         # Always enable drag mode regardless of zoom level
@@ -29,8 +59,33 @@ class PatternGraphicsView(QGraphicsView):
         # Optional: Enable mouse tracking for better interaction feedback
         self.setMouseTracking(True)
 
-        # Optional: Set viewport update mode for smoother updates during interaction
-        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Only repaint the damaged region on the raster viewport; an OpenGL
+        # viewport redraws its whole surface anyway. The painter state is not
+        # saved around each item: items do leave their pen, brush or font set,
+        # but every item sets all the state it draws with before drawing, so
+        # what the previous item left behind is never used.
+        # Exposed areas get no extra antialiasing margin: the scenes are static
+        # once built, so the view only repaints strips newly exposed by
+        # scrolling and the whole viewport after zooming or when antialiasing
+        # is restored. No item is ever repainted on its own, which is when
+        # stroke pixels just outside its bounding rect would be left stale.
+        if use_opengl:
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
+
+        # The grid background is rendered once into a pixmap and reused
+        # until the view is zoomed
+        self.setCacheMode(QGraphicsView.CacheBackground)
+
+        # Light gray dotted lines for the grid, stronger lines for the axes
+        self._grid_pen = QPen(Qt.lightGray)
+        self._grid_pen.setStyle(Qt.DotLine)
+        self._grid_pen.setWidthF(0.5)
+        self._axis_pen = QPen(Qt.darkGray)
+        self._axis_pen.setStyle(Qt.SolidLine)
+        self._axis_pen.setWidthF(1.0)
 
         # Set a reasonable minimum size
         self.setMinimumSize(300, 200)
@@ -40,6 +95,83 @@ class PatternGraphicsView(QGraphicsView):
         self._pan_start_x = 0
         self._pan_start_y = 0
 
+        # Antialiasing is switched off while zooming or panning and restored
+        # once the view has been still for a moment
+        self._antialiasing_suspended = False
+        self._antialiasing_timer = QTimer(self)
+        self._antialiasing_timer.setSingleShot(True)
+        self._antialiasing_timer.setInterval(150)
+        self._antialiasing_timer.timeout.connect(self._restore_antialiasing)
+
+        # Wheel steps arriving within one frame are combined into one scale
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._flush_zoom)
+
+        # Arrow key steps queued before the next event loop pass are
+        # scrolled together
+        self._pending_scroll_x = 0
+        self._pending_scroll_y = 0
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(0)
+        self._scroll_timer.timeout.connect(self._flush_scroll)
+
+    def _suspend_antialiasing(self):
+        """Render without antialiasing until the view stops moving"""
+        if not self._antialiasing_suspended:
+            self._antialiasing_suspended = True
+            self.setRenderHint(QPainter.Antialiasing, False)
+        self._antialiasing_timer.start()
+
+    def _restore_antialiasing(self):
+        """Turn antialiasing back on and redraw the visible items with it"""
+        self._antialiasing_suspended = False
+        self.setRenderHint(QPainter.Antialiasing, True)
+
+        # Cached items keep the pixmap rendered during the motion until
+        # they are updated, which also refreshes their cache; the viewport is
+        # then repainted as a whole, antialiased edges included
+        for item in self.items(self.viewport().rect()):
+            item.update()
+        self.viewport().update()
+
+    def drawBackground(self, painter, rect):
+        """
+        Draw the reference grid behind the scene items
+
+        Only the grid lines crossing the exposed rectangle are drawn, in one
+        call per pen, instead of keeping a line item per grid line in the scene.
+
+        Args:
+            painter: Painter in scene coordinates
+            rect: Exposed scene rectangle
+        """
+        super().drawBackground(painter, rect)
+
+        size = self.GRID_SIZE
+        extent = self.GRID_EXTENT
+        if rect.right() < 0 or rect.bottom() < 0 or rect.left() > extent or rect.top() > extent:
+            return
+
+        first_x = max(0, math.ceil(rect.left() / size) * size)
+        first_y = max(0, math.ceil(rect.top() / size) * size)
+        end_x = min(math.floor(rect.right()) + 1, extent)
+        end_y = min(math.floor(rect.bottom()) + 1, extent)
+
+        # Horizontal and vertical lines
+        lines = [QLineF(0, y, extent, y) for y in range(first_y, end_y, size)]
+        lines.extend(QLineF(x, 0, x, extent) for x in range(first_x, end_x, size))
+
+        painter.setPen(self._grid_pen)
+        painter.drawLines(lines)
+
+        # Main horizontal and vertical lines
+        painter.setPen(self._axis_pen)
+        painter.drawLines([QLineF(0, 0, extent, 0), QLineF(0, 0, 0, extent)])
+
     def wheelEvent(self, event):
         """
         Handle mouse wheel zoom events
@@ -50,6 +182,18 @@ class PatternGraphicsView(QGraphicsView):
         factor = 1.1
         if event.angleDelta().y() < 0:
             factor = 1.0 / factor
+        self._suspend_antialiasing()
+
+        # A fast flick of the wheel sends several events per frame; apply
+        # their combined factor once instead of rescaling for each of them
+        self._pending_zoom *= factor
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _flush_zoom(self):
+        """Apply the zoom accumulated from the wheel since the last frame"""
+        factor = self._pending_zoom
+        self._pending_zoom = 1.0
         self.scale(factor, factor)
 
     def mousePressEvent(self, event):
@@ -77,6 +221,9 @@ class PatternGraphicsView(QGraphicsView):
         Args:
             event: Mouse event
         """
+        if self._panning or event.buttons() & Qt.LeftButton:
+            self._suspend_antialiasing()
+
         if self._panning:
             # Calculate how much to pan
             dx = event.x() - self._pan_start_x
@@ -115,14 +262,28 @@ class PatternGraphicsView(QGraphicsView):
         Args:
             event: Key event
         """
-        # Add keyboard navigation (arrow keys)
+        # Add keyboard navigation (arrow keys). Held keys repeat faster than
+        # the view repaints, so steps are summed and applied together
         if event.key() == Qt.Key_Left:
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - 20)
+            self._pending_scroll_x -= 20
         elif event.key() == Qt.Key_Right:
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + 20)
+            self._pending_scroll_x += 20
         elif event.key() == Qt.Key_Up:
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - 20)
+            self._pending_scroll_y -= 20
         elif event.key() == Qt.Key_Down:
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() + 20)
+            self._pending_scroll_y += 20
         else:
-            super().keyPressEvent(event)
\ No newline at end of file
+            super().keyPressEvent(event)
+            return
+
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _flush_scroll(self):
+        """Scroll by the arrow key steps accumulated since the last flush"""
+        if self._pending_scroll_x:
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + self._pending_scroll_x)
+        if self._pending_scroll_y:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().value() + self._pending_scroll_y)
+        self._pending_scroll_x = 0
+        self._pending_scroll_y = 0
@@ -0,0 +1,66 @@
+"""
+Graphics item for drawing text labels over a scene.
+"""
+from PyQt5.QtWidgets import QGraphicsItem
+from PyQt5.QtGui import QStaticText, QTransform
+from PyQt5.QtCore import QPointF, QRectF
+
+
+class LabelOverlay(QGraphicsItem):
+    """Single scene item that draws many short labels"""
+
+    def __init__(self, labels, font, color, parent=None):
+        """
+        Initialize the label overlay
+
+        Each label is laid out once as a QStaticText, so painting only draws
+        the cached glyphs instead of keeping a text item with its own
+        document per label.
+
+        Args:
+            labels: List of (x, y, text) tuples, each centered on (x, y)
+            font: Font shared by all labels
+            color: Text color
+            parent: Parent item
+        """
+        super().__init__(parent)
+        self._font = font
+        self._color = color
+        self._labels = []
+
+        bounds = QRectF()
+        for x, y, text in labels:
+            static_text = QStaticText(text)
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            static_text.prepare(QTransform(), font)
+            size = static_text.size()
+
+            top_left = QPointF(x - size.width() / 2, y - size.height() / 2)
+            self._labels.append((top_left, static_text))
+            bounds = bounds.united(QRectF(top_left, size))
+        self._bounds = bounds
+
+    def boundingRect(self):
+        """
+        Get the bounding rectangle of the item
+
+        Returns:
+            QRectF: Area covered by all labels
+        """
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the labels
+
+        Args:
+            painter: Painter in item coordinates
+            option: Style options
+            widget: Widget being painted on
+        """
+        # The view doesn't save the painter state between items, so all the
+        # state used here is set first
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        for top_left, static_text in self._labels:
+            painter.drawStaticText(top_left, static_text)
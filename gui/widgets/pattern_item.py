@@ -0,0 +1,69 @@
+"""
+Graphics item for drawing pattern pieces in a scene.
+"""
+from PyQt5.QtWidgets import QGraphicsItem
+
+
+class PatternItem(QGraphicsItem):
+    """Lightweight scene item that draws a pattern path"""
+
+    def __init__(self, path, pen, brush, parent=None, path_bounds=None):
+        """
+        Initialize the pattern item
+
+        A QGraphicsPathItem with a non-zero pen strokes the whole path to
+        compute its bounding rect. The outline pens here are thin, so the path
+        bounds padded by half the pen width cover the stroke without building
+        a stroked outline. The path itself is only rasterized when the item
+        is exposed.
+
+        Args:
+            path: QPainterPath of the pattern
+            pen: Outline pen
+            brush: Fill brush
+            parent: Parent item
+            path_bounds: Precomputed path.boundingRect(), for items that
+                share a path
+        """
+        super().__init__(parent)
+        self._path = path
+        self._pen = pen
+        self._brush = brush
+
+        if path_bounds is None:
+            path_bounds = path.boundingRect()
+        half_width = pen.widthF() / 2
+        self._bounds = path_bounds.adjusted(-half_width, -half_width, half_width, half_width)
+
+    def path(self):
+        """
+        Get the pattern path
+
+        Returns:
+            QPainterPath: Path drawn by the item
+        """
+        return self._path
+
+    def boundingRect(self):
+        """
+        Get the bounding rectangle of the item
+
+        Returns:
+            QRectF: Path bounds including the outline
+        """
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the pattern
+
+        Args:
+            painter: Painter in item coordinates
+            option: Style options
+            widget: Widget being painted on
+        """
+        # The view doesn't save the painter state between items, so all the
+        # state used here is set first
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
+        painter.drawPath(self._path)
@@ -1,84 +1,103 @@
 """
-Pattern preview widget for showing small pattern piece previews.
+Small pattern piece previews for the pattern table.
 """
-from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPainter, QBrush, QPen
+from PyQt5.QtGui import QPainter, QBrush, QPen, QPixmap
 from PyQt5.QtCore import Qt
 
 
-class PatternPreviewWidget(QWidget):
-    """Widget to display a preview of a pattern piece"""
-
-    def __init__(self, parent=None):
-        """
-        Initialize the pattern preview widget
-        
-        Args:
-            parent: Parent widget
-        """
-        super().__init__(parent)
-        self.setMinimumSize(60, 60)
-        self.setMaximumSize(60, 60)  # Fix maximum size to ensure it fits in the cell
-        self.pattern_path = None
-        self.color = Qt.red
-
-    def set_pattern(self, path, color=None):
-        """
-        Set the pattern path to display
-        
-        Args:
-            path: QPainterPath for the pattern
-            color: Optional color for the pattern
-        """
-        self.pattern_path = path
-        if color:
-            self.color = color
-        self.update()
-
-    def paintEvent(self, event):
-        """
-        Paint the pattern preview
-        
-        Args:
-            event: Paint event
-        """
-        if not self.pattern_path:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Fill background with white for better contrast
-        painter.fillRect(self.rect(), Qt.white)
-
-        # Calculate scaling to fit the widget with padding
-        bounds = self.pattern_path.boundingRect()
-        if bounds.width() <= 0 or bounds.height() <= 0:
-            return
-
-        # Add padding (reduce usable area to 90% of widget size)
-        padding = 3
-        usable_width = self.width() - (padding * 2)
-        usable_height = self.height() - (padding * 2)
-
-        scale_x = usable_width / bounds.width() if bounds.width() > 0 else 1
-        scale_y = usable_height / bounds.height() if bounds.height() > 0 else 1
-        scale = min(scale_x, scale_y)  # Use smaller scale to maintain aspect ratio
-
-        # Center the pattern
-        painter.translate(
-            self.width() / 2 - (bounds.width() * scale) / 2 - bounds.x() * scale,
-            self.height() / 2 - (bounds.height() * scale) / 2 - bounds.y() * scale
-        )
-        painter.scale(scale, scale)
-
-        # Draw the pattern with thin pen and dotted pattern fill (like in the reference image)
-        pen = QPen(self.color)
-        pen.setWidthF(0.8 / scale)  # Thinner pen width for clearer preview
-        painter.setPen(pen)
-
-        # Use a dotted pattern fill for better visibility - matching the reference images
-        pattern = Qt.Dense4Pattern
-        brush = QBrush(self.color, pattern)
-        painter.fillPath(self.pattern_path, brush)
-        painter.drawPath(self.pattern_path)
\ No newline at end of file
+# Side length of a pattern preview in pixels
+PREVIEW_SIZE = 60
+
+
+def preview_transform(width, height, bounds):
+    """
+    Compute the scale and offset that fit a pattern into an area
+
+    Args:
+        width: Width of the area
+        height: Height of the area
+        bounds: Bounding rect of the pattern path
+
+    Returns:
+        tuple: (scale, dx, dy), or None if the pattern has no area
+    """
+    # Calculate scaling to fit the area with padding
+    if bounds.width() <= 0 or bounds.height() <= 0:
+        return None
+
+    # Add padding (reduce usable area to 90% of widget size)
+    padding = 3
+    usable_width = width - (padding * 2)
+    usable_height = height - (padding * 2)
+
+    scale_x = usable_width / bounds.width() if bounds.width() > 0 else 1
+    scale_y = usable_height / bounds.height() if bounds.height() > 0 else 1
+    scale = min(scale_x, scale_y)  # Use smaller scale to maintain aspect ratio
+
+    # Center the pattern
+    dx = width / 2 - (bounds.width() * scale) / 2 - bounds.x() * scale
+    dy = height / 2 - (bounds.height() * scale) / 2 - bounds.y() * scale
+    return scale, dx, dy
+
+
+def draw_pattern_preview(painter, width, height, path, color, transform=None):
+    """
+    Draw a pattern scaled and centered to fit an area
+
+    Args:
+        painter: Painter positioned at the top-left corner of the area
+        width: Width of the area
+        height: Height of the area
+        path: QPainterPath for the pattern
+        color: Color for the pattern
+        transform: Result of preview_transform for this area and path,
+            computed here if None
+    """
+    if transform is None:
+        transform = preview_transform(width, height, path.boundingRect())
+    if transform is None:
+        return
+
+    scale, dx, dy = transform
+    painter.translate(dx, dy)
+    painter.scale(scale, scale)
+
+    # Draw the pattern with thin pen and dotted pattern fill (like in the reference image)
+    pen = QPen(color)
+    pen.setWidthF(0.8 / scale)  # Thinner pen width for clearer preview
+    painter.setPen(pen)
+
+    # Use a dotted pattern fill for better visibility - matching the reference images
+    pattern = Qt.Dense4Pattern
+    painter.setBrush(QBrush(color, pattern))
+
+    # Fill and outline in a single pass over the path
+    painter.drawPath(path)
+
+
+def render_pattern_thumbnail(path, color, size=PREVIEW_SIZE, bounds=None, pixel_ratio=1.0):
+    """
+    Render a pattern preview into a pixmap
+
+    Args:
+        path: QPainterPath for the pattern
+        color: Color for the pattern
+        size: Side length of the thumbnail in device-independent pixels
+        bounds: Precomputed path.boundingRect(), computed here if None
+        pixel_ratio: Device pixel ratio of the screen the thumbnail is shown on
+
+    Returns:
+        QPixmap: Preview on a white background, sharp at the given pixel ratio
+    """
+    pixmap = QPixmap(round(size * pixel_ratio), round(size * pixel_ratio))
+    pixmap.setDevicePixelRatio(pixel_ratio)
+    pixmap.fill(Qt.white)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    if bounds is None:
+        bounds = path.boundingRect()
+    draw_pattern_preview(painter, size, size, path, color, preview_transform(size, size, bounds))
+    painter.end()
+
+    return pixmap
@@ -2,14 +2,132 @@
 Nesting task model for pattern nesting application.
 """
 import os
+import glob
 import time
 import re
+import mmap
+import contextlib
+import signal
+import platform
+import traceback
 import subprocess
+import tempfile
 import threading
+import itertools
+from functools import lru_cache
 from datetime import datetime
 
 from core.parser import parse_ses_file
 
+# Patterns searched in the raw bytes of DXF and SES files, compiled once.
+# The tokens are plain ASCII, so no text decoding is needed to find them.
+_DXF_BLOCK_RE = re.compile(rb'BLOCK\s+2\s+B\d+')
+# All SES fields in one alternation, so the file is scanned once; the name
+# of the matched group tells which field a match is. Every alternative starts
+# with a literal keyword and has no nested repetition, so the scan stays
+# linear in the file size with the standard re module
+_SES_FIELDS_RE = re.compile(
+    rb'MARKER_EFFICIENCY\s+(?P<efficiency>\d+(?:\.\d+)?)'
+    rb'|EFFICIENCY:\s+(?P<efficiency_alt>\d+(?:\.\d+)?)'
+    rb'|MARKER_LENGTH\s+(?P<length>\d+(?:\.\d+)?)'
+    rb'|HEIGHT:\s+(?P<length_alt>\d+(?:\.\d+)?)'
+)
+_BEGIN_PIECE_RE = re.compile(rb'BEGIN_PIECE')
+
+# The marker fields of a SES file are in its header, which is searched first
+_SES_HEADER_SIZE = 1 << 16
+
+
+@contextlib.contextmanager
+def _mapped_file(path):
+    """
+    Map a file read-only into memory
+
+    Regexes run directly on the mapping, so the file is neither copied into
+    the process nor decoded; the OS pages in what the scan touches.
+
+    Args:
+        path (str): Path to the file
+
+    Yields:
+        Bytes-like contents of the file
+    """
+    with open(path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+@lru_cache(maxsize=256)
+def _count_pattern_blocks(path, mtime_ns, size):
+    """
+    Count the pattern blocks of a DXF file
+
+    Several tasks are often created for the same drawing, so counts are
+    cached. The modification time and size are part of the key only to
+    invalidate the count when the file changes.
+
+    Args:
+        path (str): Real path to the DXF file
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+
+    Returns:
+        int: Number of BLOCK entries whose name is 'B' followed by digits
+    """
+    with _mapped_file(path) as content:
+        return len(_DXF_BLOCK_RE.findall(content))
+
+
+def _ses_field_values(content):
+    """
+    Find the marker fields of a SES file
+
+    Args:
+        content: Bytes-like contents to search
+
+    Returns:
+        dict: First value found for each group of _SES_FIELDS_RE
+    """
+    values = {}
+    for match in _SES_FIELDS_RE.finditer(content):
+        if match.lastgroup not in values:
+            values[match.lastgroup] = float(match.group(match.lastgroup))
+    return values
+
+
+def _is_new_or_modified(st, st_before):
+    """
+    Check whether a file was created or modified since it was last stat'ed
+
+    Args:
+        st (os.stat_result): Current stat of the file, None if it doesn't exist
+        st_before (os.stat_result): Earlier stat of the file, None if it didn't exist
+
+    Returns:
+        bool: True if the file exists and is new or has a later modification time
+    """
+    return st is not None and (st_before is None or st.st_mtime_ns > st_before.st_mtime_ns)
+
+
+def _stat_or_none(path):
+    """
+    Stat a file that may not exist
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        os.stat_result: Result of os.stat, or None if the file can not be stat'ed
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 class NestingTask:
     """Class representing a nesting task"""
@@ -19,7 +137,11 @@ class NestingTask:
     STATUS_STOPPED = "Прервано"
     STATUS_ERROR = "Ошибка"
 
-    def __init__(self, dxf_file, nesting_program, wrk_file=None, width=50.0, time_limit=5 * 60):
+    # Source of task ids, unique for the lifetime of the application
+    _ids = itertools.count(1)
+
+    def __init__(self, dxf_file, nesting_program, wrk_file=None, width=50.0, time_limit=5 * 60,
+                 poll_interval_min=0.1, poll_interval_max=1.0):
         """
         Initialize a nesting task
         
@@ -29,19 +151,29 @@ class NestingTask:
             wrk_file (str, optional): Path to WRK file. If None, generated from DXF path
             width (float, optional): Width for nesting. Defaults to 50.0
             time_limit (int, optional): Time limit in seconds. Defaults to 5 minutes
+            poll_interval_min (float, optional): Seconds between the first checks for
+                the SES file while the program runs. Defaults to 0.1
+            poll_interval_max (float, optional): Longest time between those checks,
+                reached while nothing changes. Defaults to 1.0
         """
+        self.id = next(NestingTask._ids)  # Stable identifier, unlike the task's list position
         self.dxf_file = dxf_file
+        self.file_name = os.path.basename(dxf_file)  # DXF file name shown in the task list
+        self.ses_file = os.path.splitext(dxf_file)[0] + ".ses"  # Expected result file
         self.nesting_program = nesting_program
         self.wrk_file = wrk_file or self._generate_wrk_filename(dxf_file)
         self.width = width
         self.time_limit = time_limit  # In seconds
+        self.poll_interval_min = poll_interval_min  # In seconds
+        self.poll_interval_max = poll_interval_max  # In seconds
 
         self.status = self.STATUS_WAITING
-        self.start_time = None
+        self.start_time = None  # For display
+        self._start_mono = None  # time.monotonic() at start, for measuring progress
         self.end_time = None
         self.progress_time = 0  # In seconds
         self.efficiency = 0.0
-        self.pattern_count = self._count_patterns_in_dxf()
+        self._pattern_count = None  # Counted from the DXF file on first use
         self.length = 0.0
 
         # Process control
@@ -50,6 +182,25 @@ class NestingTask:
         self.stop_flag = False
         self.is_running = False
 
+    @property
+    def pattern_count(self):
+        """
+        Number of pattern pieces
+
+        Counted from the DXF file the first time it is needed, so creating
+        many tasks does not read their files up front.
+
+        Returns:
+            int: Number of pattern pieces
+        """
+        if self._pattern_count is None:
+            self._pattern_count = self._count_patterns_in_dxf()
+        return self._pattern_count
+
+    @pattern_count.setter
+    def pattern_count(self, value):
+        self._pattern_count = value
+
     def _generate_wrk_filename(self, dxf_file):
         """
         Generate a WRK filename from the DXF filename
@@ -73,17 +224,8 @@ class NestingTask:
         """
         try:
             # Simple method: count blocks that start with 'B' in the DXF file
-            pattern_count = 0
-
-            # Open the DXF file and scan for blocks
-            with open(self.dxf_file, 'r', errors='ignore') as f:
-                content = f.read()
-
-                # Look for BLOCK entries that start with 'B'
-                blocks = re.findall(r'BLOCK\s+2\s+B\d+', content)
-                pattern_count = len(blocks)
-
-            return pattern_count
+            st = os.stat(self.dxf_file)
+            return _count_pattern_blocks(os.path.realpath(self.dxf_file), st.st_mtime_ns, st.st_size)
         except Exception as e:
             print(f"Error counting patterns in DXF: {e}")
             return 0
@@ -112,6 +254,8 @@ class NestingTask:
         self.stop_flag = False
         self.status = self.STATUS_RUNNING
         self.start_time = datetime.now()
+        self._start_mono = time.monotonic()
+        self.progress_time = 0
         self.is_running = True
 
         self.thread = threading.Thread(target=self._run_task)
@@ -135,7 +279,7 @@ class NestingTask:
         if self.process:
             try:
                 print("Terminating process...")
-                self.process.terminate()
+                self._terminate_process()
             except Exception as e:
                 print(f"Error terminating process: {e}")
 
@@ -144,14 +288,36 @@ class NestingTask:
         self.is_running = False
         return True
 
+    def _terminate_process(self, kill=False):
+        """
+        Terminate the nesting program
+
+        Outside Windows the program runs in its own session, so the signal is
+        sent to its whole process group and also reaches the processes it
+        started.
+
+        Args:
+            kill (bool, optional): Kill the program instead of asking it to exit
+        """
+        if platform.system() == 'Windows':
+            if kill:
+                self.process.kill()
+            else:
+                self.process.terminate()
+            return
+
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        except ProcessLookupError:
+            # The program and everything it started have already exited
+            pass
+
     def update_progress(self):
         """
         Update the progress time if the task is running
         """
-        if self.is_running and self.start_time:
-            current_time = datetime.now()
-            delta = current_time - self.start_time
-            self.progress_time = int(delta.total_seconds())
+        if self.is_running and self._start_mono is not None:
+            self.progress_time = int(time.monotonic() - self._start_mono)
 
     def _run_task(self):
         """
@@ -187,193 +353,212 @@ class NestingTask:
             # Determine expected SES file path - multiple ways to construct it
             dxf_basename = os.path.splitext(os.path.basename(self.dxf_file))[0]
             dxf_dir = os.path.dirname(self.dxf_file)
-            ses_file_paths = [
-                os.path.join(dxf_dir, f"{dxf_basename}.ses"),
-                os.path.join(os.path.dirname(wrk_file), f"{dxf_basename}.ses")
-            ]
+            # The WRK file is usually next to the DXF, so both are often the
+            # same file; each distinct path is kept once
+            ses_file_paths = list(dict.fromkeys(
+                os.path.normcase(os.path.realpath(os.path.join(directory, f"{dxf_basename}.ses")))
+                for directory in (dxf_dir, os.path.dirname(wrk_file))
+            ))
 
             # Print the file paths we'll be checking
             for path in ses_file_paths:
                 print(f"Will check for SES file at: {path}")
 
-            # Check if SES file already exists before starting (to detect changes)
-            ses_exists_before = any(os.path.exists(path) for path in ses_file_paths)
-            if ses_exists_before:
-                # Store modification times of existing files
-                ses_mtimes_before = {}
-                for path in ses_file_paths:
-                    if os.path.exists(path):
-                        ses_mtimes_before[path] = os.path.getmtime(path)
-                        print(f"Existing SES file found at {path} with mtime {ses_mtimes_before[path]}")
+            # Stat the SES files before starting (to detect changes),
+            # None for the ones that don't exist yet
+            ses_stats_before = {path: _stat_or_none(path) for path in ses_file_paths}
+            for path, st in ses_stats_before.items():
+                if st is not None:
+                    print(f"Existing SES file found at {path} with mtime {st.st_mtime}")
 
             # Set working directory to the nesting program directory
             program_dir = os.path.dirname(nesting_program)
 
-            # Create process
-            import platform
-            if platform.system() == 'Windows':
-                try:
+            # The output of the program is not used, and its error output only
+            # when it fails. It goes to a file rather than a pipe: nothing reads
+            # a pipe while the program runs, so a full one would block it
+            with tempfile.TemporaryFile(mode='w+', errors='replace') as stderr_file:
+                # Create process
+                if platform.system() == 'Windows':
+                    try:
+                        self.process = subprocess.Popen(
+                            [nesting_program, wrk_file],
+                            stdout=subprocess.DEVNULL,
+                            stderr=stderr_file,
+                            cwd=program_dir,
+                            creationflags=subprocess.CREATE_NO_WINDOW
+                        )
+                    except Exception as e:
+                        print(f"Process creation without shell failed: {e}")
+                        self.process = subprocess.Popen(
+                            f'"{nesting_program}" "{wrk_file}"',
+                            stdout=subprocess.DEVNULL,
+                            stderr=stderr_file,
+                            cwd=program_dir,
+                            shell=True
+                        )
+                else:
+                    # In a session of its own, the program and anything it
+                    # starts can be terminated together
                     self.process = subprocess.Popen(
                         [nesting_program, wrk_file],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        cwd=program_dir,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                except Exception as e:
-                    print(f"Process creation without shell failed: {e}")
-                    self.process = subprocess.Popen(
-                        f'"{nesting_program}" "{wrk_file}"',
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=stderr_file,
                         cwd=program_dir,
-                        shell=True
+                        start_new_session=True
                     )
-            else:
-                self.process = subprocess.Popen(
-                    [nesting_program, wrk_file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=program_dir
-                )
-
-            if not self.process:
-                print("Failed to create process")
-                self.status = self.STATUS_ERROR
-                self.end_time = datetime.now()
-                self.is_running = False
-                self._notify_task_completed()
-                return
-
-            print(f"Process started with PID: {self.process.pid}")
 
-            # Initialize start time and progress
-            start_time = time.time()
-            self.progress_time = 0
-            process_terminated = False
+                if not self.process:
+                    print("Failed to create process")
+                    self.status = self.STATUS_ERROR
+                    self.end_time = datetime.now()
+                    self.is_running = False
+                    self._notify_task_completed()
+                    return
 
-            # Wait for process to complete with progress updates
-            while self.process.poll() is None:
-                # Check if we should stop
-                if self.stop_flag:
-                    print("Stop flag detected, terminating process")
-                    self.process.terminate()
-                    process_terminated = True
-                    break
-
-                # Update progress time
-                current_time = time.time()
-                self.progress_time = int(current_time - start_time)
-
-                # Check if we've exceeded the time limit
-                if self.progress_time >= self.time_limit:
-                    print(f"Time limit ({self.time_limit}s) reached, terminating process")
-                    self.process.terminate()
-                    process_terminated = True
-                    break
-
-                # Check if SES file has appeared while process is running
-                # This helps in cases where the process creates the file but doesn't exit
-                for ses_path in ses_file_paths:
-                    if os.path.exists(ses_path):
-                        # Check if it's new or modified
-                        if ses_exists_before and ses_path in ses_mtimes_before:
-                            # Check if modified
-                            current_mtime = os.path.getmtime(ses_path)
-                            if current_mtime > ses_mtimes_before[ses_path]:
-                                print(f"SES file {ses_path} was modified during processing")
-                        else:
-                            print(f"New SES file detected at {ses_path} during processing")
+                print(f"Process started with PID: {self.process.pid}")
+
+                # Initialize start time; progress_time is kept current by
+                # update_progress, since this thread only wakes up for checks
+                start_time = time.monotonic()
+                process_terminated = False
+
+                # The SES file checks only report what the program is doing, so
+                # the time between them grows while nothing changes, up to
+                # poll_interval_max, and each file is reported once
+                poll_interval = self.poll_interval_min
+                next_ses_check = start_time
+                ses_reported = set()
+
+                # Wait for process to complete with progress updates
+                while self.process.poll() is None:
+                    # Check if we should stop
+                    if self.stop_flag:
+                        print("Stop flag detected, terminating process")
+                        self._terminate_process()
+                        process_terminated = True
+                        break
 
-                # Sleep to avoid busy waiting
-                time.sleep(0.1)
+                    current_time = time.monotonic()
 
-            # Process has completed or was terminated
-            return_code = self.process.poll()
-            try:
-                stdout, stderr = self.process.communicate(timeout=2)
-            except subprocess.TimeoutExpired:
-                print("Process did not communicate within timeout, forcing termination")
-                self.process.kill()
-                stdout, stderr = self.process.communicate()
-                return_code = -1
+                    # Check if we've exceeded the time limit
+                    if current_time - start_time >= self.time_limit:
+                        print(f"Time limit ({self.time_limit}s) reached, terminating process")
+                        self._terminate_process()
+                        process_terminated = True
+                        break
 
-            # Calculate final time
-            elapsed = time.time() - start_time
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-            print(f"Process completed in {minutes}:{seconds:02d}")
+                    # Check if SES file has appeared while process is running
+                    # This helps in cases where the process creates the file but doesn't exit
+                    if current_time >= next_ses_check:
+                        reported_before = len(ses_reported)
+                        for ses_path in ses_file_paths:
+                            if ses_path in ses_reported:
+                                continue
+                            if _is_new_or_modified(_stat_or_none(ses_path), ses_stats_before[ses_path]):
+                                print(f"SES file {ses_path} was created or modified during processing")
+                                ses_reported.add(ses_path)
+
+                        if len(ses_reported) > reported_before:
+                            poll_interval = self.poll_interval_min
+                        else:
+                            poll_interval = min(poll_interval * 1.5, self.poll_interval_max)
+                        next_ses_check = current_time + poll_interval
+
+                    # Wait for the process until the next SES check or the time
+                    # limit, whichever comes first. Its exit is noticed as soon
+                    # as it happens, and stop() terminates it, which ends the
+                    # wait as well, so there is no need to wake up in between
+                    wait_until = min(next_ses_check, start_time + self.time_limit)
+                    try:
+                        self.process.wait(timeout=max(wait_until - time.monotonic(), 0))
+                    except subprocess.TimeoutExpired:
+                        pass
+
+                # Process has completed or was terminated
+                try:
+                    return_code = self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    print("Process did not exit within timeout, forcing termination")
+                    self._terminate_process(kill=True)
+                    self.process.wait()
+                    return_code = -1
+
+                # Calculate final time
+                elapsed = time.monotonic() - start_time
+                minutes = int(elapsed) // 60
+                seconds = int(elapsed) % 60
+                print(f"Process completed in {minutes}:{seconds:02d}")
+
+                # Wait a short time to ensure any file operations have completed
+                print("Waiting for file operations to complete...")
+                time.sleep(1)
+
+                # Check for SES file existence - more thoroughly this time
+                ses_file_exists = False
+                ses_file_path = None
 
-            # Wait a short time to ensure any file operations have completed
-            print("Waiting for file operations to complete...")
-            time.sleep(1)
+                for path in ses_file_paths:
+                    print(f"Checking for SES file at: {path}")
+                    st = _stat_or_none(path)
+                    if st is not None:
+                        mtime_str = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                        print(f"SES file found at {path}, size={st.st_size} bytes, modified={mtime_str}")
+
+                        # Check if file was just created/modified
+                        if _is_new_or_modified(st, ses_stats_before[path]):
+                            print(f"SES file at {path} is new or was modified during processing")
+                            ses_file_exists = True
+                            ses_file_path = path
+                            break
+                        else:
+                            print(f"SES file at {path} exists but wasn't modified during processing")
+
+                if not ses_file_exists:
+                    # One more check - look for any .ses files in the directory
+                    # whose name starts with the DXF name
+                    pattern = os.path.join(glob.escape(dxf_dir), glob.escape(dxf_basename) + '*.ses')
+                    for full_path in glob.iglob(pattern):
+                        if os.path.isfile(full_path):
+                            print(f"Found alternative SES file: {full_path}")
+                            ses_file_exists = True
+                            ses_file_path = full_path
+                            break
 
-            # Check for SES file existence - more thoroughly this time
-            ses_file_exists = False
-            ses_file_path = None
+                print(f"Final SES file exists check result: {ses_file_exists}")
 
-            for path in ses_file_paths:
-                print(f"Checking for SES file at: {path}")
-                if os.path.exists(path):
-                    file_size = os.path.getsize(path)
-                    file_mtime = os.path.getmtime(path)
-                    mtime_str = datetime.fromtimestamp(file_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"SES file found at {path}, size={file_size} bytes, modified={mtime_str}")
-
-                    # Check if file was just created/modified (within last minute)
-                    if not ses_exists_before or path not in ses_mtimes_before or file_mtime > ses_mtimes_before[path]:
-                        print(f"SES file at {path} is new or was modified during processing")
-                        ses_file_exists = True
-                        ses_file_path = path
-                        break
-                    else:
-                        print(f"SES file at {path} exists but wasn't modified during processing")
-
-            if not ses_file_exists:
-                # One more check - look for any .ses files in the directory
-                for file in os.listdir(dxf_dir):
-                    if file.endswith('.ses') and file.startswith(dxf_basename):
-                        full_path = os.path.join(dxf_dir, file)
-                        print(f"Found alternative SES file: {full_path}")
-                        ses_file_exists = True
-                        ses_file_path = full_path
-                        break
+                # Update status based on result
+                if self.stop_flag:
+                    self.status = self.STATUS_STOPPED
+                    print("Process was stopped by user")
+                elif ses_file_exists:
+                    # If the SES file exists, consider the task completed successfully
+                    self.status = self.STATUS_COMPLETED
+                    print(f"Process completed successfully - SES file found at {ses_file_path}")
 
-            print(f"Final SES file exists check result: {ses_file_exists}")
-
-            # Update status based on result
-            if self.stop_flag:
-                self.status = self.STATUS_STOPPED
-                print("Process was stopped by user")
-            elif ses_file_exists:
-                # If the SES file exists, consider the task completed successfully
-                self.status = self.STATUS_COMPLETED
-                print(f"Process completed successfully - SES file found at {ses_file_path}")
-
-                # Use the found SES path for parsing
-                self._parse_results(ses_file_path)
-            elif return_code == 0:
-                self.status = self.STATUS_COMPLETED
-                print("Process completed successfully with exit code 0")
-            else:
-                # Check one last time if SES file exists in any location
-                final_check = any(os.path.exists(path) for path in ses_file_paths)
-                if final_check:
+                    # Use the found SES path for parsing
+                    self._parse_results(ses_file_path)
+                elif return_code == 0:
                     self.status = self.STATUS_COMPLETED
-                    print("Final check found SES file exists, marking as completed")
-                    # Find the path that exists
-                    for path in ses_file_paths:
-                        if os.path.exists(path):
-                            self._parse_results(path)
-                            break
+                    print("Process completed successfully with exit code 0")
                 else:
-                    self.status = self.STATUS_ERROR
-                    print(f"Process failed with error code {return_code}")
-                    if stderr:
-                        print(f"Error output: {stderr[:500]}")
+                    # Check one last time if SES file exists in any location
+                    final_check = any(os.path.exists(path) for path in ses_file_paths)
+                    if final_check:
+                        self.status = self.STATUS_COMPLETED
+                        print("Final check found SES file exists, marking as completed")
+                        # Find the path that exists
+                        for path in ses_file_paths:
+                            if os.path.exists(path):
+                                self._parse_results(path)
+                                break
+                    else:
+                        self.status = self.STATUS_ERROR
+                        print(f"Process failed with error code {return_code}")
+                        stderr_file.seek(0)
+                        stderr = stderr_file.read(500)
+                        if stderr:
+                            print(f"Error output: {stderr}")
 
             self.end_time = datetime.now()
             self.is_running = False
@@ -382,7 +567,6 @@ class NestingTask:
             self._notify_task_completed()
 
         except Exception as e:
-            import traceback
             print(f"Error running nesting task: {e}")
             traceback.print_exc()
             self.status = self.STATUS_ERROR
@@ -410,46 +594,45 @@ class NestingTask:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(self.wrk_file), exist_ok=True)
 
-            with open(self.wrk_file, 'w') as f:
-                f.write("NESTING-WORK-FILE\n")
-
-                # Get directory paths
-                dxf_dir = os.path.dirname(self.dxf_file)
-                wrk_dir = os.path.dirname(self.wrk_file)
-
-                # Write file paths
-                f.write(f"CHDIR {wrk_dir}\n")
-                f.write(f"IMPORT DXF {self.dxf_file}\n")
-                f.write("BUILD_NEST 0\n")
-                f.write("BEGIN_TASK\n")
-                f.write(f"MARKER_FILE_DIRECTORY  {wrk_dir}\n")
-                f.write(f"SESSION_FILE_DIRECTORY {wrk_dir}\n")
-
-                # Get the filename without extension
-                dxf_basename = os.path.splitext(os.path.basename(self.dxf_file))[0]
-
-                # Add marker file section
-                f.write("BEGIN_MARKER_FILE\n")
-                f.write(f"{dxf_basename}.dat\n")
-                f.write("END_MARKER_FILE\n")
-
-                # Add automatic actions
-                f.write("BEGIN_AUTOMATIC_ACTIONS\n")
-                time_limit_minutes = self.time_limit // 60
-                f.write(f"NEST_COMPLETE MIN_EFF=0 MAX_EFF=100 TIME={time_limit_minutes} ")
-                f.write("NUM_SAVE=1 OPTIONALS=10\n")
-                f.write("END_AUTOMATIC_ACTIONS\n")
-                f.write("END_TASK\n")
+            # Get directory paths
+            dxf_dir = os.path.dirname(self.dxf_file)
+            wrk_dir = os.path.dirname(self.wrk_file)
 
+            # Get the filename without extension
+            dxf_basename = os.path.splitext(os.path.basename(self.dxf_file))[0]
+            ses_file = os.path.join(dxf_dir, f"{dxf_basename}.ses")
+            time_limit_minutes = self.time_limit // 60
+
+            # The file is built as a list of lines and written at once
+            lines = [
+                "NESTING-WORK-FILE",
+                # File paths
+                f"CHDIR {wrk_dir}",
+                f"IMPORT DXF {self.dxf_file}",
+                "BUILD_NEST 0",
+                "BEGIN_TASK",
+                f"MARKER_FILE_DIRECTORY  {wrk_dir}",
+                f"SESSION_FILE_DIRECTORY {wrk_dir}",
+                # Marker file section
+                "BEGIN_MARKER_FILE",
+                f"{dxf_basename}.dat",
+                "END_MARKER_FILE",
+                # Automatic actions
+                "BEGIN_AUTOMATIC_ACTIONS",
+                f"NEST_COMPLETE MIN_EFF=0 MAX_EFF=100 TIME={time_limit_minutes} NUM_SAVE=1 OPTIONALS=10",
+                "END_AUTOMATIC_ACTIONS",
+                "END_TASK",
                 # Export session file
-                ses_file = os.path.join(dxf_dir, f"{dxf_basename}.ses")
-                f.write(f"EXPORT dxf {ses_file}\n")
-                f.write("END_WORK_FILE\n")
+                f"EXPORT dxf {ses_file}",
+                "END_WORK_FILE",
+            ]
+
+            with open(self.wrk_file, 'w') as f:
+                f.write("\n".join(lines) + "\n")
 
             print(f"WRK file generated successfully: {self.wrk_file}")
             return True
         except Exception as e:
-            import traceback
             print(f"Error generating WRK file: {e}")
             traceback.print_exc()
             return False
@@ -501,46 +684,42 @@ class NestingTask:
             # If parse_ses_file returned None or incomplete data, fall back to basic parsing
             print("Basic parsing result data due to missing information")
             
-            with open(ses_file_path, 'r', errors='ignore') as f:
-                content = f.read()
-
-                # Extract marker efficiency
-                if "MARKER_EFFICIENCY" in content:
-                    efficiency_match = re.search(r'MARKER_EFFICIENCY\s+(\d+(\.\d+)?)', content)
-                    if efficiency_match:
-                        self.efficiency = float(efficiency_match.group(1))
-                        print(f"Extracted efficiency: {self.efficiency}")
-
-                # Alternative efficiency format
-                elif "EFFICIENCY:" in content:
-                    efficiency_match = re.search(r'EFFICIENCY:\s+(\d+(\.\d+)?)', content)
-                    if efficiency_match:
-                        self.efficiency = float(efficiency_match.group(1))
-                        print(f"Extracted efficiency (alt format): {self.efficiency}")
-
-                # Extract marker length
-                if "MARKER_LENGTH" in content:
-                    length_match = re.search(r'MARKER_LENGTH\s+(\d+(\.\d+)?)', content)
-                    if length_match:
-                        self.length = float(length_match.group(1))
-                        print(f"Extracted length: {self.length}")
-
-                # Alternative length format
-                elif "HEIGHT:" in content:
-                    length_match = re.search(r'HEIGHT:\s+(\d+(\.\d+)?)', content)
-                    if length_match:
-                        self.length = float(length_match.group(1))
-                        print(f"Extracted length (alt format): {self.length}")
+            with _mapped_file(ses_file_path) as content:
+                # Search the header for the marker fields, and the whole
+                # file only if one of them is not there
+                header = content[:_SES_HEADER_SIZE]
+                values = _ses_field_values(header)
+                if len(header) < len(content) and not (
+                        ('efficiency' in values or 'efficiency_alt' in values)
+                        and ('length' in values or 'length_alt' in values)):
+                    values = _ses_field_values(content)
+
+                # Extract marker efficiency, or the alternative format
+                if 'efficiency' in values:
+                    self.efficiency = values['efficiency']
+                    print(f"Extracted efficiency: {self.efficiency}")
+                elif 'efficiency_alt' in values:
+                    self.efficiency = values['efficiency_alt']
+                    print(f"Extracted efficiency (alt format): {self.efficiency}")
+
+                # Extract marker length, or the alternative format
+                if 'length' in values:
+                    self.length = values['length']
+                    print(f"Extracted length: {self.length}")
+                elif 'length_alt' in values:
+                    self.length = values['length_alt']
+                    print(f"Extracted length (alt format): {self.length}")
 
                 # Count pattern pieces
-                if self.pattern_count == 0 and "BEGIN_PIECE" in content:
-                    self.pattern_count = content.count("BEGIN_PIECE")
-                    print(f"Counted {self.pattern_count} pattern pieces")
+                if self.pattern_count == 0:
+                    piece_count = len(_BEGIN_PIECE_RE.findall(content))
+                    if piece_count:
+                        self.pattern_count = piece_count
+                        print(f"Counted {self.pattern_count} pattern pieces")
                 
                 return True
 
         except Exception as e:
-            import traceback
             print(f"Error parsing SES file: {e}")
             traceback.print_exc()
             return False
\ No newline at end of file